@@ -139,7 +139,7 @@ check_server_status() {
                 return 0
             else
                 warn "Stale PID file found. Cleaning up..."
-                rm -f /tmp/egregore.pid /tmp/egregore.lock
+                rm -f /tmp/egregore.pid
                 return 1
             fi
         else
@@ -567,7 +567,7 @@ main() {
                         egregore-server stop
                     elif [ -f "/tmp/egregore.pid" ]; then
                         kill "$(cat /tmp/egregore.pid)" 2>/dev/null || true
-                        rm -f /tmp/egregore.pid /tmp/egregore.lock
+                        rm -f /tmp/egregore.pid
                         success "Server stopped"
                     else
                         warn "Server is not running"
@@ -637,7 +637,7 @@ handle_standalone_flag() {
                 egregore-server stop
             elif [ -f "/tmp/egregore.pid" ]; then
                 kill "$(cat /tmp/egregore.pid)" 2>/dev/null || true
-                rm -f /tmp/egregore.pid /tmp/egregore.lock
+                rm -f /tmp/egregore.pid
                 success "Server stopped"
             else
                 warn "Server is not running"
@@ -1,8 +1,29 @@
 """Egregore Skill - Hive Mind Memory CLI."""
 
-from .client import EgregoreClient
-from .main import main
-from .ui import UI, Colors, Spinner, MemoryFormatter
+from typing import Any
 
 __version__ = "2.0.0"
 __all__ = ["EgregoreClient", "main", "UI", "Colors", "Spinner", "MemoryFormatter"]
+
+# Exports resolved lazily (PEP 562) so importing the package doesn't pull
+# in httpx/sseclient before they're actually needed
+_LAZY_EXPORTS = {
+    "EgregoreClient": "client",
+    "main": "main",
+    "UI": "ui",
+    "Colors": "ui",
+    "Spinner": "ui",
+    "MemoryFormatter": "ui",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,129 @@
+"""Semantic similarity cache for recall results."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+class SemanticCache:
+    """Bounded similarity cache over query embeddings.
+
+    Stores (embedding, payload) pairs and answers a lookup when the best
+    cached cosine similarity reaches the threshold, so paraphrases of the
+    same intent reuse results without a server round trip.
+
+    Embeddings live in one preallocated contiguous int8 matrix with a
+    per-row float32 scale, so a lookup is a single matrix-vector product
+    at a quarter of the memory bandwidth of float32 — the scan is
+    memory-bound, so that translates almost directly into speed. Vectors
+    are L2-normalized before quantization, which keeps the cosine
+    threshold meaningful. Recency is tracked in a logical order array
+    (most recent first); hits shift int32 indices instead of moving
+    embedding rows, and eviction overwrites the least-recent row in place.
+    """
+
+    def __init__(self, capacity: int = 512, threshold: float = 0.40) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of cached entries
+            threshold: Minimum cosine similarity to count as a hit
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        # Matrix is allocated on first insert, when the dimension is known
+        self._qvecs: np.ndarray | None = None
+        self._scales = np.empty(capacity, dtype=np.float32)
+        self._payloads: list[Any] = [None] * capacity
+        self._order = np.empty(capacity, dtype=np.int32)
+        self._count = 0
+
+    @staticmethod
+    def _normalize(vec: Any) -> np.ndarray:
+        """L2-normalize a vector to float32."""
+        v = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(v))
+        return v / norm if norm else v
+
+    @staticmethod
+    def _quantize(v: np.ndarray) -> tuple[np.ndarray, float]:
+        """Quantize a normalized float32 vector to int8 plus a scale."""
+        scale = float(np.abs(v).max()) / 127 or 1.0
+        return (v / scale).round().astype(np.int8), scale
+
+    def _touch(self, row: int) -> None:
+        """Move a row to the front of the logical recency order."""
+        order = self._order
+        pos = int(np.nonzero(order[: self._count] == row)[0][0])
+        if pos:
+            order[1 : pos + 1] = order[:pos].copy()
+            order[0] = row
+
+    def lookup(self, vec: Any) -> Any | None:
+        """Return the payload most similar to vec, or None on a miss."""
+        if self._count == 0 or self._qvecs is None:
+            return None
+
+        qvec, qscale = self._quantize(self._normalize(vec))
+        # int32 accumulation: int8*int8 sums overflow int16 at these dims
+        raw = self._qvecs[: self._count].astype(np.int32) @ qvec.astype(np.int32)
+        scores = raw.astype(np.float32) * (self._scales[: self._count] * qscale)
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None
+
+        self._touch(best)
+        return self._payloads[best]
+
+    def insert(self, vec: Any, payload: Any) -> None:
+        """Insert a new entry, overwriting the least-recent row if full."""
+        qvec, scale = self._quantize(self._normalize(vec))
+        if self._qvecs is None:
+            self._qvecs = np.empty((self.capacity, qvec.shape[0]), dtype=np.int8)
+
+        if self._count < self.capacity:
+            row = self._count
+            self._count += 1
+        else:
+            row = int(self._order[self.capacity - 1])
+
+        self._qvecs[row] = qvec
+        self._scales[row] = scale
+        self._payloads[row] = payload
+
+        order = self._order
+        order[1 : self._count] = order[: self._count - 1].copy()
+        order[0] = row
+
+    def warm(self, vecs: Any, payloads: list[Any]) -> None:
+        """Bulk-load entries, replacing current contents.
+
+        Normalizes and quantizes all rows in one vectorized pass and drops
+        them straight into the cache matrix — intended for startup warming
+        from a batch-embedding call.
+        """
+        n = min(len(payloads), self.capacity)
+        if n == 0:
+            return
+
+        mat = np.asarray(vecs, dtype=np.float32)[:n]
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        mat = mat / norms
+        scales = np.abs(mat).max(axis=1) / 127
+        scales[scales == 0] = 1.0
+
+        if self._qvecs is None:
+            self._qvecs = np.empty((self.capacity, mat.shape[1]), dtype=np.int8)
+        self._qvecs[:n] = (mat / scales[:, None]).round().astype(np.int8)
+        self._scales[:n] = scales
+        self._payloads[:n] = payloads[:n]
+        self._order[:n] = np.arange(n, dtype=np.int32)
+        self._count = n
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._count = 0
+        self._payloads = [None] * self.capacity
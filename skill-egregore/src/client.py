@@ -2,17 +2,81 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import os
-from typing import Any
-from urllib.parse import urljoin
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
-import requests
-import sseclient
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    import json as orjson  # type: ignore[no-redef]
+
+
+def _iter_sse(chunks: Iterator[bytes]) -> Iterator[tuple[str, str]]:
+    """Parse an SSE byte stream into (event, data) pairs.
+
+    Minimal splitter for the two event types the server emits. Buffers
+    whole chunks and splits on the frame delimiter, instead of
+    sseclient's byte-at-a-time scanning.
+    """
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk.replace(b"\r\n", b"\n")
+        while (end := buffer.find(b"\n\n")) != -1:
+            frame, buffer = buffer[:end], buffer[end + 2:]
+            event = "message"
+            data_parts = []
+            for line in frame.split(b"\n"):
+                if line.startswith(b"event:"):
+                    event = line[6:].strip().decode()
+                elif line.startswith(b"data:"):
+                    data_parts.append(line[5:].strip())
+            if data_parts:
+                yield event, b"\n".join(data_parts).decode()
+
+
+try:
+    from .cache import SemanticCache
+except ImportError:  # pragma: no cover - numpy is optional
+    SemanticCache = None  # type: ignore[assignment, misc]
+
+# Recall cache bounds: repeated/paraphrased queries in interactive mode
+# hit the same results within a session
+RECALL_CACHE_SIZE = 256
+RECALL_CACHE_TTL = 300.0  # seconds
+
+# JSON-RPC envelope built by bytes formatting; only the arguments dict
+# goes through the JSON encoder
+_RPC_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"tools/call",'
+    b'"params":{"name":"%s","arguments":%s}}'
+)
+
+# MCP initialize request/notification; the server rejects tool calls
+# sent before this exchange completes
+_INIT_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"initialize","params":'
+    b'{"protocolVersion":"2024-11-05","capabilities":{},'
+    b'"clientInfo":{"name":"egregore-skill","version":"0.1.0"}}}'
+)
+_INITIALIZED_NOTIFICATION = b'{"jsonrpc":"2.0","method":"notifications/initialized"}'
 
 
 class EgregoreClient:
-    """Client for Egregore SSE server."""
+    """Client for Egregore SSE server.
+
+    Keeps a single long-lived SSE connection per client and multiplexes
+    JSON-RPC tool calls over it by request id, so only the first call pays
+    the connection setup and endpoint-handshake latency.
+    """
 
     def __init__(self, base_url: str | None = None) -> None:
         """Initialize client.
@@ -20,39 +84,256 @@ class EgregoreClient:
         Args:
             base_url: Server URL. Defaults to EGREGORE_URL env var or localhost:9000.
         """
+        # Deferred so importing the module (e.g. for help output) doesn't
+        # pay the httpx import cost
+        import httpx
+
         self.base_url = base_url or os.environ.get(
             "EGREGORE_URL", "http://localhost:9000"
         )
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Accept": "text/event-stream",
-            "Cache-Control": "no-cache",
-        })
+        # Endpoints are precomputed once; base_url never changes, so
+        # there's no need to re-run urljoin on every call
+        self._root_url = self.base_url.rstrip("/")
+        self.sse_url = self._root_url + "/sse"
+        # HTTP/2 multiplexes the SSE stream and tool-call POSTs over a
+        # single connection, so repeated calls skip the handshake cost.
+        self.session = httpx.Client(
+            http2=True,
+            headers={
+                "Accept": "text/event-stream",
+                "Cache-Control": "no-cache",
+            },
+            timeout=None,
+        )
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._pending: dict[int, queue.Queue[dict[str, Any]]] = {}
+        self._response: httpx.Response | None = None
+        self._post_url: str | None = None
+        self._reader: threading.Thread | None = None
+        self._recall_cache: OrderedDict[
+            tuple[Any, ...], tuple[float, list[dict[str, Any]]]
+        ] = OrderedDict()
+        self._semantic_cache = SemanticCache() if SemanticCache is not None else None
+
+    def __enter__(self) -> EgregoreClient:
+        return self
 
-    def _endpoint(self, path: str) -> str:
-        """Build full URL."""
-        return urljoin(self.base_url, path)
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the SSE stream and the underlying connection."""
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+            self._post_url = None
+        self.session.close()
+
+    def _ensure_connected(self) -> None:
+        """Open the SSE stream once and wait for the endpoint handshake."""
+        if self._post_url is not None:
+            return
+
+        request = self.session.build_request("GET", self.sse_url)
+        response = self.session.send(request, stream=True)
+        response.raise_for_status()
+        self._response = response
+
+        events = _iter_sse(response.iter_bytes())
+        for event, data in events:
+            if event == "endpoint":
+                self._post_url = self._root_url + data
+                break
+
+        if self._post_url is None:
+            raise ConnectionError("No endpoint received from SSE server")
+
+        # Remaining events are responses to tool calls; route them from a
+        # background thread so concurrent calls can share the stream.
+        self._reader = threading.Thread(
+            target=self._read_events, args=(events,), daemon=True
+        )
+        self._reader.start()
+        self._handshake()
+
+    def _handshake(self) -> None:
+        """Run the MCP initialize exchange before any tool call.
+
+        The server answers requests sent before initialize/
+        notifications/initialized with -32602 "Received request before
+        initialization was complete", so this must complete on connect.
+        """
+        self._next_id += 1
+        call_id = self._next_id
+        replies: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=1)
+        self._pending[call_id] = replies
+        try:
+            self._post(_INIT_TEMPLATE % call_id)
+            data = replies.get(timeout=60)
+        finally:
+            self._pending.pop(call_id, None)
+        if "error" in data:
+            raise ConnectionError(f"MCP initialize failed: {data['error']}")
+        self._post(_INITIALIZED_NOTIFICATION)
+
+    def _post(self, body: bytes) -> None:
+        """POST one JSON-RPC payload to the session endpoint."""
+        response = self.session.post(
+            self._post_url,
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+
+    def _read_events(self, events: Iterator[tuple[str, str]]) -> None:
+        """Route message events to the queue of the matching request id."""
+        try:
+            for event, data in events:
+                if event != "message":
+                    continue
+                payload = orjson.loads(data)
+                pending = self._pending.get(payload.get("id"))
+                if pending is not None:
+                    pending.put(payload)
+        except Exception:
+            # Stream closed (server shutdown or close()); pending calls
+            # will time out and surface the error themselves.
+            pass
 
     def health_check(self) -> dict[str, Any]:
         """Check server health."""
         try:
             # SSE health check via tool call
             response = self._call_tool("health_check", {})
-            return json.loads(response) if isinstance(response, str) else response
+            return orjson.loads(response) if isinstance(response, str) else response
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
     def recall(
-        self, query: str, limit: int = 5, user_id: str = "egregore"
+        self,
+        query: str,
+        limit: int = 5,
+        user_id: str = "egregore",
+        context: str | None = None,
+        tags: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Search memories by semantic similarity."""
+        """Search memories by semantic similarity.
+
+        Identical queries within RECALL_CACHE_TTL are answered from a
+        bounded LRU cache instead of a server round trip. Context/tag
+        filters are applied server-side.
+        """
+        key = (query, limit, user_id, context, tuple(tags) if tags else None)
+        cached = self._recall_cache.get(key)
+        if cached is not None:
+            ts, results = cached
+            if time.monotonic() - ts < RECALL_CACHE_TTL:
+                self._recall_cache.move_to_end(key)
+                # Deep-copy so callers can't mutate the cached entry
+                return copy.deepcopy(results)
+            del self._recall_cache[key]
+
+        # Approximate hit: paraphrased queries reuse results when their
+        # embeddings are close enough (unfiltered queries only)
+        qvec: list[float] | None = None
+        if self._semantic_cache is not None and context is None and tags is None:
+            qvec = self._embed_query(query)
+            if qvec is not None:
+                hit = self._semantic_cache.lookup(qvec)
+                if hit is not None and hit["limit"] == limit and hit["user_id"] == user_id:
+                    return copy.deepcopy(hit["results"])
+
+        arguments: dict[str, Any] = {"query": query, "limit": limit, "user_id": user_id}
+        if context:
+            arguments["context"] = context
+        if tags:
+            arguments["tags"] = ",".join(tags)
+
+        response = self._call_tool("recall_memory", arguments)
+        if isinstance(response, str):
+            data = orjson.loads(response)
+            memories = data.get("memories", [])
+            results = memories.get("results", []) if isinstance(memories, dict) else memories
+        else:
+            results = []
+
+        self._recall_cache[key] = (time.monotonic(), copy.deepcopy(results))
+        if len(self._recall_cache) > RECALL_CACHE_SIZE:
+            self._recall_cache.popitem(last=False)
+        if self._semantic_cache is not None and qvec is not None:
+            self._semantic_cache.insert(
+                qvec,
+                {"limit": limit, "user_id": user_id, "results": copy.deepcopy(results)},
+            )
+        return results
+
+    def _embed_query(self, query: str) -> list[float] | None:
+        """Embed a query server-side; None if the tool is unavailable."""
+        try:
+            response = self._call_tool("embed_query", {"query": query})
+        except Exception:
+            return None
+        if isinstance(response, str):
+            return orjson.loads(response).get("embedding")
+        return None
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed many texts in a single tool call."""
+        response = self._call_tool("batch_embed", {"texts": texts})
+        if isinstance(response, str):
+            return orjson.loads(response).get("embeddings", [])
+        return []
+
+    def warm_semantic_cache(self, n: int = 64, user_id: str = "egregore") -> int:
+        """Pre-embed recent memories so early queries hit the semantic cache.
+
+        Returns:
+            Number of entries loaded into the cache
+        """
+        if self._semantic_cache is None:
+            return 0
+
+        pairs = [
+            (mem.get("memory") or mem.get("data", ""), mem)
+            for mem in self.recent(n, user_id=user_id)
+        ]
+        pairs = [(text, mem) for text, mem in pairs if text]
+        if not pairs:
+            return 0
+
+        vecs = self.embed_batch([text for text, _ in pairs])
+        self._semantic_cache.warm(
+            vecs,
+            [{"limit": 5, "user_id": user_id, "results": [mem]} for _, mem in pairs],
+        )
+        return len(vecs)
+
+    def recall_cache_clear(self) -> None:
+        """Drop all cached recall results."""
+        self._recall_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    def stats(self, user_id: str = "egregore", sample: int = 100) -> dict[str, Any]:
+        """Get server-side aggregated memory statistics."""
+        response = self._call_tool(
+            "compute_stats",
+            {"user_id": user_id, "sample": sample}
+        )
+        if isinstance(response, str):
+            return orjson.loads(response)
+        return response
+
+    def recent(self, n: int = 10, user_id: str = "egregore") -> list[dict[str, Any]]:
+        """Get the n most recent memories, already sorted server-side."""
         response = self._call_tool(
-            "recall_memory",
-            {"query": query, "limit": limit, "user_id": user_id}
+            "recent_memories",
+            {"n": n, "user_id": user_id}
         )
         if isinstance(response, str):
-            data = json.loads(response)
-            return data.get("memories", {}).get("results", [])
+            data = orjson.loads(response)
+            return data.get("memories", [])
         return []
 
     def store(
@@ -73,58 +354,45 @@ class EgregoreClient:
             }
         )
         if isinstance(response, str):
-            return json.loads(response)
+            return orjson.loads(response)
         return response
 
     def _call_tool(self, tool_name: str, params: dict[str, Any]) -> Any:
-        """Call an MCP tool via SSE."""
-        # Connect to SSE endpoint
-        url = self._endpoint("/sse")
-        response = self.session.get(url, stream=True)
-        response.raise_for_status()
-
-        client = sseclient.SSEClient(response)
-
-        try:
-            # Wait for endpoint event
-            endpoint = None
-            for event in client.events():
-                if event.event == "endpoint":
-                    endpoint = event.data
-                    break
-
-            if not endpoint:
-                raise ConnectionError("No endpoint received from SSE server")
-
-            # Send tool call via POST
-            message = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": params
-                }
-            }
+        """Call an MCP tool over the shared SSE connection."""
+        with self._lock:
+            self._ensure_connected()
+            self._next_id += 1
+            call_id = self._next_id
 
-            post_url = self._endpoint(endpoint)
-            post_response = self.session.post(
-                post_url,
-                json=message,
-                headers={"Content-Type": "application/json"}
-            )
-            post_response.raise_for_status()
+        replies: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=1)
+        self._pending[call_id] = replies
 
-            # Wait for response via SSE
-            for event in client.events():
-                if event.event == "message":
-                    data = json.loads(event.data)
-                    if "result" in data:
-                        return data["result"]
-                    elif "error" in data:
-                        raise RuntimeError(data["error"])
+        arguments = orjson.dumps(params)
+        if isinstance(arguments, str):  # stdlib json fallback returns str
+            arguments = arguments.encode()
+        body = _RPC_TEMPLATE % (call_id, tool_name.encode(), arguments)
 
+        try:
+            self._post(body)
+            # Wait for the response routed by the reader thread
+            data = replies.get(timeout=60)
         finally:
-            response.close()
+            self._pending.pop(call_id, None)
 
+        if "result" in data:
+            result = data["result"]
+            # Tool results arrive wrapped in a CallToolResult envelope;
+            # unwrap the first text block so callers get the tool's own
+            # JSON string back
+            if isinstance(result, dict):
+                content = result.get("content")
+                if isinstance(content, list) and content:
+                    first = content[0]
+                    if isinstance(first, dict) and "text" in first:
+                        if result.get("isError"):
+                            raise RuntimeError(first["text"])
+                        return first["text"]
+            return result
+        if "error" in data:
+            raise RuntimeError(data["error"])
         return {}
@@ -4,24 +4,40 @@
 from __future__ import annotations
 
 import argparse
-import json
-import os
+import contextlib
 import sys
-from datetime import datetime
-from typing import Any
+from collections import Counter
+from typing import TYPE_CHECKING, Any
 
-from .client import EgregoreClient
 from .ui import UI, MemoryFormatter
 
+if TYPE_CHECKING:
+    from .client import EgregoreClient
+
+# Shared UI so commands (and interactive mode's tight loop) don't rebuild
+# the spinner and color helpers on every call
+ui = UI()
+
+
+# Singleton client so all commands in a process (notably interactive
+# mode) reuse one SSE connection
+_client: EgregoreClient | None = None
+
 
 def get_client() -> EgregoreClient:
-    """Get configured client."""
-    return EgregoreClient()
+    """Get or create the shared client instance."""
+    global _client
+    if _client is None:
+        # Deferred so commands that never touch the network (help, cache)
+        # don't pay the httpx/sseclient import cost
+        from .client import EgregoreClient
+
+        _client = EgregoreClient()
+    return _client
 
 
 def cmd_recall(args: argparse.Namespace) -> int:
     """Search memories."""
-    ui = UI()
     client = get_client()
 
     ui.info(f"🔍 Searching: {args.query}")
@@ -38,9 +54,11 @@ def cmd_recall(args: argparse.Namespace) -> int:
         ui.success(f"Found {len(results)} memories")
         print()
 
-        for i, mem in enumerate(results, 1):
+        blocks = [
             MemoryFormatter.format_memory(mem, index=i)
-            print()
+            for i, mem in enumerate(results, 1)
+        ]
+        sys.stdout.write("\n\n".join(blocks) + "\n\n")
 
         return 0
 
@@ -52,7 +70,6 @@ def cmd_recall(args: argparse.Namespace) -> int:
 
 def cmd_store(args: argparse.Namespace) -> int:
     """Store a memory."""
-    ui = UI()
     client = get_client()
 
     # Interactive mode if no data provided
@@ -86,7 +103,6 @@ def cmd_store(args: argparse.Namespace) -> int:
 
 def cmd_search(args: argparse.Namespace) -> int:
     """Advanced search with filters."""
-    ui = UI()
     client = get_client()
 
     ui.info(f"🔍 Advanced search: {args.query}")
@@ -103,29 +119,15 @@ def cmd_search(args: argparse.Namespace) -> int:
     ui.spinner.start()
 
     try:
-        results = client.recall(args.query, args.limit or 10)
+        # Filters are applied server-side before results cross the wire
+        results = client.recall(
+            args.query,
+            args.limit or 10,
+            context=args.context,
+            tags=[t.strip() for t in args.tags.split(",")] if args.tags else None,
+        )
         ui.spinner.stop()
 
-        # Filter results if needed
-        if args.context or args.tags:
-            filtered = []
-            for mem in results:
-                meta = mem.get("metadata", {})
-                match = True
-
-                if args.context:
-                    match = match and meta.get("context") == args.context
-
-                if args.tags:
-                    mem_tags = meta.get("tags", [])
-                    search_tags = [t.strip() for t in args.tags.split(",")]
-                    match = match and any(t in mem_tags for t in search_tags)
-
-                if match:
-                    filtered.append(mem)
-
-            results = filtered
-
         if not results:
             ui.warning("No memories match the criteria")
             return 0
@@ -133,9 +135,11 @@ def cmd_search(args: argparse.Namespace) -> int:
         ui.success(f"Found {len(results)} memories")
         print()
 
-        for i, mem in enumerate(results, 1):
+        blocks = [
             MemoryFormatter.format_memory(mem, index=i)
-            print()
+            for i, mem in enumerate(results, 1)
+        ]
+        sys.stdout.write("\n\n".join(blocks) + "\n\n")
 
         return 0
 
@@ -147,7 +151,6 @@ def cmd_search(args: argparse.Namespace) -> int:
 
 def cmd_graph(args: argparse.Namespace) -> int:
     """Visualize memory graph."""
-    ui = UI()
     client = get_client()
 
     ui.info(f"🕸️  Building graph around: {args.query}")
@@ -175,7 +178,6 @@ def cmd_graph(args: argparse.Namespace) -> int:
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Check system health."""
-    ui = UI()
     client = get_client()
 
     ui.info("🏥 Checking Egregore health...")
@@ -208,30 +210,25 @@ def cmd_status(args: argparse.Namespace) -> int:
 
 def cmd_recent(args: argparse.Namespace) -> int:
     """Show recent memories."""
-    ui = UI()
     client = get_client()
 
     ui.info(f"📚 Recent {args.n} memories")
     ui.spinner.start()
 
     try:
-        # Search for all, sort by timestamp
-        results = client.recall("*", limit=args.n)
+        # Server returns memories already sorted by timestamp
+        results = client.recent(args.n)
         ui.spinner.stop()
 
         if not results:
             ui.warning("No memories found")
             return 0
 
-        # Sort by created_at if available
-        results.sort(
-            key=lambda x: x.get("metadata", {}).get("created_at", ""),
-            reverse=True
-        )
-
-        for i, mem in enumerate(results[:args.n], 1):
+        blocks = [
             MemoryFormatter.format_memory(mem, index=i)
-            print()
+            for i, mem in enumerate(results, 1)
+        ]
+        sys.stdout.write("\n\n".join(blocks) + "\n\n")
 
         return 0
 
@@ -243,46 +240,40 @@ def cmd_recent(args: argparse.Namespace) -> int:
 
 def cmd_stats(args: argparse.Namespace) -> int:
     """Show statistics."""
-    ui = UI()
     client = get_client()
 
     ui.info("📊 Memory Statistics")
     ui.spinner.start()
 
     try:
-        # Get sample of memories for stats
-        results = client.recall("*", limit=100)
+        # Histograms are aggregated server-side
+        stats = client.stats()
         ui.spinner.stop()
 
-        if not results:
+        total = stats.get("total", 0)
+        if not total:
             ui.warning("No memories found")
             return 0
 
-        # Calculate stats
-        contexts: dict[str, int] = {}
-        tags: dict[str, int] = {}
-
-        for mem in results:
-            meta = mem.get("metadata", {})
-
-            ctx = meta.get("context", "uncategorized")
-            contexts[ctx] = contexts.get(ctx, 0) + 1
-
-            for tag in meta.get("tags", []):
-                tags[tag] = tags.get(tag, 0) + 1
+        contexts = Counter(stats.get("contexts", {}))
+        tags = Counter(stats.get("tags", {}))
 
         ui.header("Overview")
-        print(f"  Total memories: {len(results)}")
+        print(f"  Total memories: {total}")
 
         ui.header("By Context")
-        for ctx, count in sorted(contexts.items(), key=lambda x: -x[1]):
-            bar = "█" * min(count, 20)
-            print(f"  {ctx:15} {bar} {count}")
+        sys.stdout.write(
+            "".join(
+                f"  {ctx:15} {'█' * min(count, 20)} {count}\n"
+                for ctx, count in contexts.most_common()
+            )
+        )
 
         if tags:
             ui.header("Top Tags")
-            for tag, count in sorted(tags.items(), key=lambda x: -x[1])[:10]:
-                print(f"  #{tag}: {count}")
+            sys.stdout.write(
+                "".join(f"  #{tag}: {count}\n" for tag, count in tags.most_common(10))
+            )
 
         return 0
 
@@ -294,11 +285,14 @@ def cmd_stats(args: argparse.Namespace) -> int:
 
 def cmd_interactive(args: argparse.Namespace) -> int:
     """Start interactive mode."""
-    ui = UI()
-
     ui.banner("🐝 Egregore Interactive Mode")
     ui.info("Type 'help' for commands, 'quit' to exit\n")
 
+    # Warm the similarity cache from recent memories (one batched call);
+    # skip silently if the server is down or numpy is missing
+    with contextlib.suppress(Exception):
+        get_client().warm_semantic_cache()
+
     while True:
         try:
             cmd = ui.prompt("egregore").strip()
@@ -358,10 +352,19 @@ def cmd_interactive(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_cache(args: argparse.Namespace) -> int:
+    """Manage client-side caches."""
+    if args.action == "clear":
+        get_client().recall_cache_clear()
+        ui.success("Recall cache cleared")
+        return 0
+
+    ui.error(f"Unknown cache action: {args.action}")
+    return 1
+
+
 def cmd_forget(args: argparse.Namespace) -> int:
     """Remove a memory."""
-    ui = UI()
-
     ui.warning(f"About to delete memory: {args.id}")
     confirm = ui.prompt("Confirm (yes/no)", "no")
 
@@ -374,83 +377,99 @@ def cmd_forget(args: argparse.Namespace) -> int:
     return 1
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Main entry point."""
-    parser = argparse.ArgumentParser(
-        prog="egregore",
-        description="🐝 Egregore - Hive Mind Memory CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  egregore recall "authentication patterns"
-  egregore store -d "Fixed CORS bug" -c bugfix -t "cors,fastapi"
-  egregore search "deployment" -c architecture
-  egregore graph "microservices" -d 3
-  egregore interactive
-        """
-    )
+def _recall_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("query", help="Search query")
+    parser.add_argument("-l", "--limit", type=int, default=5)
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    # Recall
-    recall_parser = subparsers.add_parser("recall", help="Search memories")
-    recall_parser.add_argument("query", help="Search query")
-    recall_parser.add_argument("-l", "--limit", type=int, default=5)
+def _store_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-d", "--data", help="Memory content")
+    parser.add_argument("-c", "--context", default="", help="Context")
+    parser.add_argument("-t", "--tags", default="", help="Tags")
 
-    # Store
-    store_parser = subparsers.add_parser("store", help="Store memory")
-    store_parser.add_argument("-d", "--data", help="Memory content")
-    store_parser.add_argument("-c", "--context", default="", help="Context")
-    store_parser.add_argument("-t", "--tags", default="", help="Tags")
 
-    # Search
-    search_parser = subparsers.add_parser("search", help="Advanced search")
-    search_parser.add_argument("query", help="Search query")
-    search_parser.add_argument("-c", "--context", help="Filter by context")
-    search_parser.add_argument("-t", "--tags", help="Filter by tags")
-    search_parser.add_argument("-l", "--limit", type=int)
+def _search_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("query", help="Search query")
+    parser.add_argument("-c", "--context", help="Filter by context")
+    parser.add_argument("-t", "--tags", help="Filter by tags")
+    parser.add_argument("-l", "--limit", type=int)
 
-    # Graph
-    graph_parser = subparsers.add_parser("graph", help="Visualize graph")
-    graph_parser.add_argument("query", nargs="?", default="*", help="Center query")
-    graph_parser.add_argument("-d", "--depth", type=int, default=2)
 
-    # Status
-    subparsers.add_parser("status", help="Check health")
+def _graph_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("query", nargs="?", default="*", help="Center query")
+    parser.add_argument("-d", "--depth", type=int, default=2)
 
-    # Recent
-    recent_parser = subparsers.add_parser("recent", help="Recent memories")
-    recent_parser.add_argument("-n", type=int, default=10)
 
-    # Stats
-    subparsers.add_parser("stats", help="Statistics")
+def _recent_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-n", type=int, default=10)
 
-    # Interactive
-    subparsers.add_parser("interactive", help="Interactive mode")
 
-    # Forget
-    forget_parser = subparsers.add_parser("forget", help="Delete memory")
-    forget_parser.add_argument("id", help="Memory ID")
+def _cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("action", choices=["clear"], help="Cache action")
 
-    args = parser.parse_args(argv)
 
-    if not args.command:
-        parser.print_help()
-        return 1
+def _forget_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Memory ID")
+
+
+# Dispatch table: handler plus an optional per-command argument builder.
+# Only the parser for the invoked command is ever constructed, keeping
+# CLI cold-start out of argparse's subparser machinery.
+COMMANDS: dict[str, tuple[Any, Any]] = {
+    "recall": (cmd_recall, _recall_args),
+    "store": (cmd_store, _store_args),
+    "search": (cmd_search, _search_args),
+    "graph": (cmd_graph, _graph_args),
+    "status": (cmd_status, None),
+    "recent": (cmd_recent, _recent_args),
+    "stats": (cmd_stats, None),
+    "interactive": (cmd_interactive, None),
+    "cache": (cmd_cache, _cache_args),
+    "forget": (cmd_forget, _forget_args),
+}
+
+HELP_TEXT = """🐝 Egregore - Hive Mind Memory CLI
+
+Usage: egregore <command> [options]
+
+Commands:
+  recall       Search memories
+  store        Store memory
+  search       Advanced search
+  graph        Visualize graph
+  status       Check health
+  recent       Recent memories
+  stats        Statistics
+  interactive  Interactive mode
+  cache        Manage caches
+  forget       Delete memory
+
+Examples:
+  egregore recall "authentication patterns"
+  egregore store -d "Fixed CORS bug" -c bugfix -t "cors,fastapi"
+  egregore search "deployment" -c architecture
+  egregore graph "microservices" -d 3
+  egregore interactive
+"""
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    command = argv[0] if argv else None
+    if command is None or command in ("-h", "--help") or command not in COMMANDS:
+        print(HELP_TEXT)
+        return 0 if command in ("-h", "--help") else 1
+
+    handler, build_args = COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"egregore {command}")
+    if build_args is not None:
+        build_args(parser)
+    args = parser.parse_args(argv[1:])
 
-    commands = {
-        "recall": cmd_recall,
-        "store": cmd_store,
-        "search": cmd_search,
-        "graph": cmd_graph,
-        "status": cmd_status,
-        "recent": cmd_recent,
-        "stats": cmd_stats,
-        "interactive": cmd_interactive,
-        "forget": cmd_forget,
-    }
-
-    return commands[args.command](args)
+    return handler(args)
 
 
 if __name__ == "__main__":
@@ -2,53 +2,79 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import threading
 from typing import Any
 
+# Emit escape codes only when stdout is an interactive terminal; piped or
+# redirected output stays clean and the color helpers become no-ops
+_TTY = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
 
-class Colors:
-    """ANSI color codes."""
 
-    BLACK = "\033[30m"
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-    WHITE = "\033[37m"
-    BOLD = "\033[1m"
-    DIM = "\033[2m"
-    RESET = "\033[0m"
+class Colors:
+    """ANSI color codes (empty when output is not a TTY or NO_COLOR is set)."""
+
+    BLACK = "\033[30m" if _TTY else ""
+    RED = "\033[31m" if _TTY else ""
+    GREEN = "\033[32m" if _TTY else ""
+    YELLOW = "\033[33m" if _TTY else ""
+    BLUE = "\033[34m" if _TTY else ""
+    MAGENTA = "\033[35m" if _TTY else ""
+    CYAN = "\033[36m" if _TTY else ""
+    WHITE = "\033[37m" if _TTY else ""
+    BOLD = "\033[1m" if _TTY else ""
+    DIM = "\033[2m" if _TTY else ""
+    RESET = "\033[0m" if _TTY else ""
+
+    # Prebuilt message prefixes so hot print paths concatenate constants
+    # instead of formatting f-strings per call
+    INFO_PREFIX = f"{BLUE}ℹ{RESET} "
+    SUCCESS_PREFIX = f"{GREEN}✓{RESET} "
+    WARNING_PREFIX = f"{YELLOW}⚠{RESET} "
+    ERROR_PREFIX = f"{RED}✗{RESET} "
+    PROMPT_PREFIX = f"{CYAN}?{RESET} "
 
 
 class Spinner:
-    """Simple spinner for loading states."""
+    """Animated spinner for loading states.
+
+    Rendering happens on a single daemon thread, so command code paths
+    never pay per-frame drawing costs. No-op when stdout is not a TTY.
+    """
 
     def __init__(self) -> None:
-        self.active = False
         self.chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-        self.idx = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
 
     def start(self) -> None:
-        """Start spinner."""
-        self.active = True
-        self._draw()
+        """Start the spinner animation."""
+        if not _TTY or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
 
     def stop(self) -> None:
-        """Stop spinner."""
-        self.active = False
-        sys.stdout.write("\r  \r")
-        sys.stdout.flush()
-
-    def _draw(self) -> None:
-        """Draw spinner frame."""
-        if not self.active:
-            return
-        char = self.chars[self.idx % len(self.chars)]
-        sys.stdout.write(f"\r{Colors.CYAN}{char}{Colors.RESET} ")
-        sys.stdout.flush()
-        self.idx += 1
+        """Stop the spinner and clear its line."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            sys.stdout.write("\r  \r")
+            sys.stdout.flush()
+
+    def _loop(self) -> None:
+        """Repaint frames until stopped."""
+        idx = 0
+        chars = self.chars
+        while not self._stop.is_set():
+            char = chars[idx % len(chars)]
+            sys.stdout.write("\r" + Colors.CYAN + char + Colors.RESET + " ")
+            sys.stdout.flush()
+            self._stop.wait(0.08)
+            idx += 1
 
 
 class UI:
@@ -58,46 +84,45 @@ class UI:
         self.spinner = Spinner()
         self.colors = Colors
 
-    def _color(self, text: str, color: str) -> str:
-        """Colorize text."""
-        return f"{color}{text}{Colors.RESET}"
-
     def red(self, text: str) -> str:
-        return self._color(text, Colors.RED)
+        return Colors.RED + text + Colors.RESET
 
     def green(self, text: str) -> str:
-        return self._color(text, Colors.GREEN)
+        return Colors.GREEN + text + Colors.RESET
 
     def yellow(self, text: str) -> str:
-        return self._color(text, Colors.YELLOW)
+        return Colors.YELLOW + text + Colors.RESET
 
     def blue(self, text: str) -> str:
-        return self._color(text, Colors.BLUE)
+        return Colors.BLUE + text + Colors.RESET
 
     def cyan(self, text: str) -> str:
-        return self._color(text, Colors.CYAN)
+        return Colors.CYAN + text + Colors.RESET
 
     def magenta(self, text: str) -> str:
-        return self._color(text, Colors.MAGENTA)
+        return Colors.MAGENTA + text + Colors.RESET
 
     def bold(self, text: str) -> str:
-        return self._color(text, Colors.BOLD)
+        return Colors.BOLD + text + Colors.RESET
+
+    def dim(self, text: str) -> str:
+        return Colors.DIM + text + Colors.RESET
 
     def info(self, text: str) -> None:
         """Print info message."""
-        print(f"{Colors.BLUE}ℹ{Colors.RESET} {text}")
+        print(Colors.INFO_PREFIX + text)
 
     def success(self, text: str) -> None:
         """Print success message."""
-        print(f"{Colors.GREEN}✓{Colors.RESET} {text}")
+        print(Colors.SUCCESS_PREFIX + text)
 
     def warning(self, text: str) -> None:
         """Print warning message."""
-        print(f"{Colors.YELLOW}⚠{Colors.RESET} {text}")
+        print(Colors.WARNING_PREFIX + text)
 
     def error(self, text: str) -> None:
         """Print error message."""
-        print(f"{Colors.RED}✗{Colors.RESET} {text}", file=sys.stderr)
+        print(Colors.ERROR_PREFIX + text, file=sys.stderr)
 
     def header(self, text: str) -> None:
         """Print header."""
@@ -109,16 +134,19 @@ class UI:
         width = len(text) + 4
         print()
         print(f"{Colors.CYAN}{'─' * width}{Colors.RESET}")
-        print(f"{Colors.CYAN}│{Colors.RESET} {Colors.BOLD}{text}{Colors.RESET} {Colors.CYAN}│{Colors.RESET}")
+        print(
+            f"{Colors.CYAN}│{Colors.RESET} {Colors.BOLD}{text}{Colors.RESET} "
+            f"{Colors.CYAN}│{Colors.RESET}"
+        )
         print(f"{Colors.CYAN}{'─' * width}{Colors.RESET}")
         print()
 
     def prompt(self, text: str, default: str = "") -> str:
         """Prompt for input."""
         if default:
-            prompt_text = f"{Colors.CYAN}?{Colors.RESET} {text} [{default}]: "
+            prompt_text = f"{Colors.PROMPT_PREFIX}{text} [{default}]: "
         else:
-            prompt_text = f"{Colors.CYAN}?{Colors.RESET} {text}: "
+            prompt_text = f"{Colors.PROMPT_PREFIX}{text}: "
 
         try:
             response = input(prompt_text).strip()
@@ -132,10 +160,12 @@ class MemoryFormatter:
     """Format memory entries for display."""
 
     @staticmethod
-    def format_memory(mem: dict[str, Any], index: int | None = None) -> None:
-        """Format a single memory."""
-        ui = UI()
+    def format_memory(mem: dict[str, Any], index: int | None = None) -> str:
+        """Format a single memory as a printable block.
 
+        Returns the block as a string so callers can buffer many memories
+        into one stdout write instead of several prints per entry.
+        """
         mem_id = mem.get("id", "unknown")[:8]
         data = mem.get("memory", mem.get("data", "No content"))
         meta = mem.get("metadata", {})
@@ -144,29 +174,36 @@ class MemoryFormatter:
         score = mem.get("score", 0)
 
         # Header with index and ID
-        if index:
-            prefix = f"{ui.bold(str(index))}."
-        else:
-            prefix = "•"
-
-        print(f"{prefix} {ui.cyan(mem_id)} {ui.dim(context)}")
-
-        # Content (truncated if too long)
-        lines = data.split("\n")
-        display = lines[0][:200]
-        if len(lines) > 1 or len(data) > 200:
+        prefix = f"{Colors.BOLD}{index}{Colors.RESET}." if index else "•"
+
+        block = [
+            f"{prefix} {Colors.CYAN}{mem_id}{Colors.RESET}"
+            f" {Colors.DIM}{context}{Colors.RESET}"
+        ]
+
+        # Content (truncated if too long); only the first line is shown,
+        # so find it instead of splitting the whole body into a list
+        nl = data.find("\n")
+        first = data if nl == -1 else data[:nl]
+        display = first[:200]
+        if nl != -1 or len(data) > 200:
             display += "..."
-        print(f"   {display}")
+        block.append(f"   {display}")
 
         # Tags
         if tags:
-            tag_str = " ".join(f"#{ui.yellow(t)}" for t in tags)
-            print(f"   {tag_str}")
+            block.append(
+                "   " + " ".join(Colors.YELLOW + "#" + t + Colors.RESET for t in tags)
+            )
 
         # Score if present
         if score:
             score_bar = "█" * int(score * 10)
-            print(f"   {ui.dim('relevance:')} {score_bar} {score:.2f}")
+            block.append(
+                f"   {Colors.DIM}relevance:{Colors.RESET} {score_bar} {score:.2f}"
+            )
+
+        return "\n".join(block)
 
     @staticmethod
     def format_graph(center: dict[str, Any], depth: int = 2) -> None:
@@ -0,0 +1,89 @@
+"""Tests for the int8 semantic cache."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.cache import SemanticCache  # noqa: E402
+
+
+def _unit(dim: int, axis: int) -> list[float]:
+    vec = [0.0] * dim
+    vec[axis] = 1.0
+    return vec
+
+
+class TestSemanticCache:
+    """Test suite for the quantized similarity cache."""
+
+    def test_hit_on_similar_vector(self):
+        cache = SemanticCache(capacity=8, threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], "payload")
+        assert cache.lookup([1.0, 0.05, 0.0]) == "payload"
+
+    def test_miss_below_threshold(self):
+        cache = SemanticCache(capacity=8, threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], "payload")
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+
+    def test_miss_when_empty(self):
+        cache = SemanticCache(capacity=8)
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
+
+    def test_eviction_overwrites_least_recent(self):
+        """Past capacity, the least-recently used row is overwritten."""
+        cache = SemanticCache(capacity=2, threshold=0.9)
+        cache.insert(_unit(3, 0), "a")
+        cache.insert(_unit(3, 1), "b")
+        cache.insert(_unit(3, 2), "c")
+        assert cache.lookup(_unit(3, 0)) is None
+        assert cache.lookup(_unit(3, 1)) == "b"
+        assert cache.lookup(_unit(3, 2)) == "c"
+
+    def test_lookup_touch_protects_entry(self):
+        """A hit refreshes recency, changing the next eviction victim."""
+        cache = SemanticCache(capacity=2, threshold=0.9)
+        cache.insert(_unit(3, 0), "a")
+        cache.insert(_unit(3, 1), "b")
+        assert cache.lookup(_unit(3, 0)) == "a"
+        cache.insert(_unit(3, 2), "c")
+        assert cache.lookup(_unit(3, 0)) == "a"
+        assert cache.lookup(_unit(3, 1)) is None
+
+    def test_quantized_scores_track_float_cosine(self):
+        """int8 scoring stays within a small error of float32 cosine."""
+        rng = np.random.default_rng(42)
+        stored = rng.standard_normal(384).astype(np.float32)
+        stored /= np.linalg.norm(stored)
+        # A nearby query: true cosine just above 0.9
+        query = stored + 0.3 * rng.standard_normal(384).astype(np.float32)
+        query /= np.linalg.norm(query)
+        cosine = float(stored @ query)
+
+        cache = SemanticCache(capacity=8, threshold=cosine - 0.02)
+        cache.insert(stored, "payload")
+        assert cache.lookup(query) == "payload"
+
+    def test_warm_bulk_load(self):
+        """warm() replaces contents with one vectorized pass."""
+        cache = SemanticCache(capacity=4, threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], "old")
+        vecs = [_unit(3, 1), _unit(3, 2)]
+        cache.warm(vecs, ["b", "c"])
+        assert cache.lookup(_unit(3, 1)) == "b"
+        assert cache.lookup(_unit(3, 2)) == "c"
+        assert cache.lookup(_unit(3, 0)) is None
+
+    def test_warm_truncates_to_capacity(self):
+        cache = SemanticCache(capacity=2, threshold=0.9)
+        vecs = [_unit(4, 0), _unit(4, 1), _unit(4, 2)]
+        cache.warm(vecs, ["a", "b", "c"])
+        assert cache.lookup(_unit(4, 0)) == "a"
+        assert cache.lookup(_unit(4, 1)) == "b"
+        assert cache.lookup(_unit(4, 2)) is None
+
+    def test_clear(self):
+        cache = SemanticCache(capacity=8, threshold=0.9)
+        cache.insert([1.0, 0.0, 0.0], "payload")
+        cache.clear()
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
@@ -0,0 +1,51 @@
+"""Tests for the SSE frame splitter."""
+
+from src.client import _iter_sse
+
+
+def _events(*chunks: bytes) -> list[tuple[str, str]]:
+    return list(_iter_sse(iter(chunks)))
+
+
+class TestIterSse:
+    """Test suite for _iter_sse."""
+
+    def test_single_frame(self):
+        assert _events(b"event: message\ndata: hello\n\n") == [("message", "hello")]
+
+    def test_default_event_type(self):
+        """Frames without an event line default to "message"."""
+        assert _events(b"data: hello\n\n") == [("message", "hello")]
+
+    def test_multiple_frames_in_one_chunk(self):
+        assert _events(b"data: one\n\ndata: two\n\n") == [
+            ("message", "one"),
+            ("message", "two"),
+        ]
+
+    def test_frame_split_across_chunks(self):
+        """A frame arriving in pieces is buffered until its delimiter."""
+        assert _events(b"event: endpoint\nda", b"ta: /messages/x\n", b"\n") == [
+            ("endpoint", "/messages/x")
+        ]
+
+    def test_delimiter_split_across_chunks(self):
+        assert _events(b"data: hello\n", b"\ndata: again\n\n") == [
+            ("message", "hello"),
+            ("message", "again"),
+        ]
+
+    def test_crlf_line_endings(self):
+        assert _events(b"event: message\r\ndata: hello\r\n\r\n") == [("message", "hello")]
+
+    def test_multiline_data_joined(self):
+        """Multiple data lines in one frame join with newlines."""
+        assert _events(b"data: line1\ndata: line2\n\n") == [("message", "line1\nline2")]
+
+    def test_frames_without_data_are_skipped(self):
+        """Comment/keepalive frames produce no events."""
+        assert _events(b": keepalive\n\n", b"data: real\n\n") == [("message", "real")]
+
+    def test_incomplete_trailing_frame_not_emitted(self):
+        """A frame missing its delimiter when the stream ends is dropped."""
+        assert _events(b"data: partial") == []
@@ -4,43 +4,101 @@ from __future__ import annotations
 
 import argparse
 import os
+import select
 import signal
-import subprocess
 import sys
 import time
 from pathlib import Path
 from typing import NoReturn
 
-import psutil
-
-from src.config import get_settings
+from src.config import settings
 
 # Constants
 PID_FILE = Path("/tmp/egregore.pid")
-LOCK_FILE = Path("/tmp/egregore.lock")
 LOG_FILE = Path("/tmp/egregore.log")
 
 
+def _wait_exit(pid: int, timeout: float) -> bool:
+    """Wait up to timeout seconds for a process to exit.
+
+    Sleeps on a pidfd via poll() so the wait returns the moment the
+    process dies instead of on the next polling tick; falls back to 50ms
+    liveness polling where pidfd_open is unavailable.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        pidfd = os.pidfd_open(pid)
+    except OSError:
+        pidfd = None
+
+    if pidfd is not None:
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            remaining = deadline - time.monotonic()
+            return bool(poller.poll(max(remaining, 0) * 1000))
+        finally:
+            os.close(pidfd)
+
+    while time.monotonic() < deadline:
+        if not _pid_alive(pid):
+            return True
+        time.sleep(0.05)
+    return not _pid_alive(pid)
+
+
+def _reap_if_exited(pid: int) -> int | None:
+    """Return the exit code of a spawned child if it has exited, else None."""
+    try:
+        done, status = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return None if _pid_alive(pid) else -1
+    if done == pid:
+        return os.waitstatus_to_exitcode(status)
+    return None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check process liveness with a zero signal (no /proc scan needed)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Process exists but belongs to another user
+        return True
+    return True
+
+
+def _is_egregore_process(pid: int) -> bool:
+    """Best-effort check that the PID belongs to an Egregore process."""
+    try:
+        comm = Path(f"/proc/{pid}/comm").read_bytes()
+        cmdline = Path(f"/proc/{pid}/cmdline").read_bytes().replace(b"\0", b" ")
+    except OSError:
+        # No /proc (non-Linux): trust the PID file
+        return True
+    return b"egregore" in comm.lower() or b"egregore" in cmdline.lower()
+
+
 def get_pid() -> int | None:
     """Get the PID of the running Egregore server if it exists."""
     if not PID_FILE.exists():
         return None
     try:
         pid = int(PID_FILE.read_text().strip())
-        # Check if process actually exists and is egregore
-        if psutil.pid_exists(pid):
-            proc = psutil.Process(pid)
-            if "egregore" in proc.name().lower() or any(
-                "egregore" in cmd.lower() for cmd in proc.cmdline()
-            ):
-                return pid
-        # Stale PID file
-        PID_FILE.unlink(missing_ok=True)
-        return None
-    except (ValueError, psutil.NoSuchProcess):
+    except ValueError:
         PID_FILE.unlink(missing_ok=True)
         return None
 
+    # Check if process actually exists and is egregore
+    if _pid_alive(pid) and _is_egregore_process(pid):
+        return pid
+
+    # Stale PID file
+    PID_FILE.unlink(missing_ok=True)
+    return None
+
 
 def is_running() -> bool:
     """Check if the Egregore server is currently running."""
@@ -63,7 +121,6 @@ def start_server(host: str, port: int, daemon: bool = True) -> int | None:
         print(f"Egregore server is already running (PID: {pid})")
         return pid
 
-    settings = get_settings()
     server_script = Path(__file__).parent / "server.py"
 
     # Environment for the server
@@ -71,39 +128,76 @@ def start_server(host: str, port: int, daemon: bool = True) -> int | None:
     env["EGREGORE_HOST"] = host
     env["EGREGORE_PORT"] = str(port)
 
+    argv = [sys.executable, str(server_script)]
     if daemon:
-        # Start as daemon process
-        with open(LOG_FILE, "a") as log:
-            process = subprocess.Popen(
-                [sys.executable, str(server_script)],
-                stdout=log,
-                stderr=subprocess.STDOUT,
-                start_new_session=True,
-                env=env,
+        # posix_spawn skips fork's copy of the CLI process; the log fd is
+        # wired to stdout/stderr via file_actions and the child detaches
+        # into its own session with setsid
+        log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            pid = os.posix_spawn(
+                sys.executable,
+                argv,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, log_fd, 1),
+                    (os.POSIX_SPAWN_DUP2, log_fd, 2),
+                    (os.POSIX_SPAWN_CLOSE, log_fd),
+                ],
+                setsid=True,
             )
+        finally:
+            os.close(log_fd)
     else:
-        # Start in foreground
-        process = subprocess.Popen(
-            [sys.executable, str(server_script)],
-            stdout=sys.stdout,
-            stderr=sys.stderr,
-            env=env,
-        )
-
-    # Wait a moment to verify it started
-    time.sleep(2)
-
-    if process.poll() is not None:
-        print(f"Failed to start Egregore server (exit code: {process.returncode})")
+        # Foreground: inherit the CLI's stdout/stderr
+        pid = os.posix_spawn(sys.executable, argv, env)
+
+    # Wait for the child to write its locked PID file or die, bounded at
+    # two seconds. A pidfd turns death detection into a poll() wakeup;
+    # the pidfile check stays a 50ms tick either way.
+    exit_code: int | None = None
+    deadline = time.monotonic() + 2.0
+    try:
+        pidfd = os.pidfd_open(pid)
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+    except OSError:
+        pidfd = None
+    try:
+        while time.monotonic() < deadline:
+            if pidfd is not None:
+                if poller.poll(50):
+                    exit_code = _reap_if_exited(pid)
+                    if exit_code is None:
+                        exit_code = -1
+                    break
+            else:
+                exit_code = _reap_if_exited(pid)
+                if exit_code is not None:
+                    break
+                time.sleep(0.05)
+            try:
+                if int(PID_FILE.read_text().strip()) == pid:
+                    break
+            except (OSError, ValueError):
+                pass
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+    if exit_code is None:
+        exit_code = _reap_if_exited(pid)
+    if exit_code is not None:
+        print(f"Failed to start Egregore server (exit code: {exit_code})")
         if LOG_FILE.exists():
             print("Last log entries:")
             print(LOG_FILE.read_text()[-500:])
         return None
 
-    print(f"Egregore server started successfully")
-    print(f"  PID: {process.pid}")
+    print("Egregore server started successfully")
+    print(f"  PID: {pid}")
     print(f"  URL: http://{host}:{port}/sse")
-    return process.pid
+    return pid
 
 
 def stop_server() -> bool:
@@ -117,27 +211,17 @@ def stop_server() -> bool:
         print("Egregore server is not running")
         # Clean up any stale files
         PID_FILE.unlink(missing_ok=True)
-        LOCK_FILE.unlink(missing_ok=True)
         return True
 
     try:
-        # Try graceful shutdown first
+        # Try graceful shutdown first; force kill if it doesn't exit
         os.kill(pid, signal.SIGTERM)
-
-        # Wait for process to terminate
-        for _ in range(10):
-            if not psutil.pid_exists(pid):
-                break
-            time.sleep(0.5)
-
-        # Force kill if still running
-        if psutil.pid_exists(pid):
+        if not _wait_exit(pid, 5.0):
             os.kill(pid, signal.SIGKILL)
-            time.sleep(0.5)
+            _wait_exit(pid, 0.5)
 
         # Clean up PID file
         PID_FILE.unlink(missing_ok=True)
-        LOCK_FILE.unlink(missing_ok=True)
 
         print(f"Egregore server stopped (PID: {pid})")
         return True
@@ -146,7 +230,6 @@ def stop_server() -> bool:
         print(f"Error stopping server: {e}")
         # Clean up stale files anyway
         PID_FILE.unlink(missing_ok=True)
-        LOCK_FILE.unlink(missing_ok=True)
         return False
 
 
@@ -157,7 +240,6 @@ def get_status() -> dict:
         Dictionary with status information
     """
     pid = get_pid()
-    settings = get_settings()
 
     if pid is None:
         return {
@@ -169,8 +251,12 @@ def get_status() -> dict:
         }
 
     try:
-        proc = psutil.Process(pid)
-        memory_info = proc.memory_info()
+        # RSS from /proc/<pid>/statm (field 1, in pages); open fds as a
+        # cheap proxy for connection count
+        statm = Path(f"/proc/{pid}/statm").read_text().split()
+        memory_mb = int(statm[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+        connections = len(os.listdir(f"/proc/{pid}/fd"))
+        create_time = Path(f"/proc/{pid}").stat().st_mtime
 
         return {
             "running": True,
@@ -178,12 +264,11 @@ def get_status() -> dict:
             "host": settings.egregore_host,
             "port": settings.egregore_port,
             "url": f"http://{settings.egregore_host}:{settings.egregore_port}/sse",
-            "cpu_percent": proc.cpu_percent(interval=0.1),
-            "memory_mb": memory_info.rss / 1024 / 1024,
-            "create_time": proc.create_time(),
-            "connections": len(proc.connections()),
+            "memory_mb": memory_mb,
+            "create_time": create_time,
+            "connections": connections,
         }
-    except psutil.NoSuchProcess:
+    except OSError:
         return {
             "running": False,
             "pid": None,
@@ -209,8 +294,55 @@ def show_status() -> None:
     print(f"  PID:        {status['pid']}")
     print(f"  URL:        {status['url']}")
     print(f"  Memory:     {status['memory_mb']:.1f} MB")
-    print(f"  CPU:        {status['cpu_percent']:.1f}%")
-    print(f"  Connections: {status['connections']}")
+    print(f"  Open files: {status['connections']}")
+
+
+def _tail_lines(path: Path, n: int) -> str:
+    """Read the last n lines of a file by scanning 8 KiB blocks backwards.
+
+    Only the tail of the file is read, so large log files don't cost a
+    full scan (or a tail subprocess) per invocation.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(8192, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return b"\n".join(data.splitlines()[-n:]).decode(errors="replace")
+
+
+def _make_log_waiter(path: Path):
+    """Build a blocking wait-for-change callable for a log file.
+
+    Uses inotify (via ctypes, Linux) so the follow loop sleeps in the
+    kernel until the file is modified; falls back to a short sleep poll
+    where inotify is unavailable.
+    """
+    try:
+        import ctypes
+        import select
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        in_modify = 0x00000002
+        if libc.inotify_add_watch(fd, str(path).encode(), in_modify) < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch")
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+
+        def wait() -> None:
+            if poller.poll(1000):
+                os.read(fd, 4096)  # drain the event
+
+        return wait
+    except (OSError, AttributeError):
+        return lambda: time.sleep(0.25)
 
 
 def show_logs(follow: bool = False, lines: int = 50) -> None:
@@ -224,23 +356,27 @@ def show_logs(follow: bool = False, lines: int = 50) -> None:
         print("No log file found")
         return
 
+    try:
+        print(_tail_lines(LOG_FILE, lines))
+    except OSError:
+        print(f"Could not read log file: {LOG_FILE}")
+        return
+
     if follow:
         print(f"Following logs from {LOG_FILE} (Ctrl+C to exit)...")
+        wait = _make_log_waiter(LOG_FILE)
         try:
-            subprocess.run(["tail", "-f", str(LOG_FILE)])
+            with open(LOG_FILE, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                while True:
+                    chunk = f.read()
+                    if chunk:
+                        sys.stdout.buffer.write(chunk)
+                        sys.stdout.buffer.flush()
+                    else:
+                        wait()
         except KeyboardInterrupt:
             print("")
-    else:
-        try:
-            # Get last N lines
-            result = subprocess.run(
-                ["tail", "-n", str(lines), str(LOG_FILE)],
-                capture_output=True,
-                text=True,
-            )
-            print(result.stdout)
-        except subprocess.CalledProcessError:
-            print(f"Could not read log file: {LOG_FILE}")
 
 
 def restart_server(host: str, port: int) -> int | None:
@@ -261,6 +397,14 @@ def restart_server(host: str, port: int) -> int | None:
 
 def main() -> NoReturn:
     """Main CLI entry point."""
+    # Fast path: status and stop take no options, so skip building the
+    # whole argparse tree for the two most frequent invocations
+    if len(sys.argv) == 2 and sys.argv[1] in ("status", "stop"):
+        if sys.argv[1] == "status":
+            show_status()
+            sys.exit(0)
+        sys.exit(0 if stop_server() else 1)
+
     parser = argparse.ArgumentParser(
         description="Egregore Server - Manage the SSE MCP server",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -337,7 +481,6 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
-    settings = get_settings()
     host = args.host if hasattr(args, "host") and args.host else settings.egregore_host
     port = args.port if hasattr(args, "port") and args.port else settings.egregore_port
 
@@ -3,8 +3,9 @@
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
-from pydantic import Field, SecretStr
+from pydantic import Field, PrivateAttr, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Get project root for .env file location
@@ -28,6 +29,9 @@ class Settings(BaseSettings):
         env_file=str(PROJECT_ROOT / ".env"),
         env_file_encoding="utf-8",
         case_sensitive=False,
+        # Settings are read-only after load; freezing also makes the
+        # precomputed derived values trustworthy for the process lifetime
+        frozen=True,
     )
 
     # Instance configuration
@@ -48,6 +52,13 @@ class Settings(BaseSettings):
         default="text-embedding-3-small",
         description="Embedding model to use (e.g., text-embedding-3-small, text-embedding-3-large)",
     )
+    recall_embedder: str = Field(
+        default="",
+        description=(
+            "Local sentence-transformers model for recall embeddings "
+            "(e.g. sentence-transformers/all-MiniLM-L6-v2); empty keeps the API embedder"
+        ),
+    )
 
     # Memgraph configuration
     memgraph_host: str = Field(default="localhost")
@@ -69,18 +80,41 @@ class Settings(BaseSettings):
         description="Port for the Egregore SSE server to listen on",
     )
 
-    @property
-    def memgraph_uri(self) -> str:
-        """Build Memgraph connection URI."""
+    _memgraph_uri: str = PrivateAttr(default="")
+    _qdrant_uri: str = PrivateAttr(default="")
+    _memgraph_auth: tuple[str, str] = PrivateAttr(default=("", ""))
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute connection URIs and auth once at load time.
+
+        Settings never change after construction (frozen=True), so
+        rebuilding the URI strings and unwrapping the password secret on
+        every access is wasted work in connection hot paths.
+        """
         auth = ""
         if self.memgraph_user:
             auth = f"{self.memgraph_user}:{self.memgraph_password.get_secret_value()}@"
-        return f"bolt://{auth}{self.memgraph_host}:{self.memgraph_port}"
+        self._memgraph_uri = f"bolt://{auth}{self.memgraph_host}:{self.memgraph_port}"
+        self._qdrant_uri = f"http://{self.qdrant_host}:{self.qdrant_port}"
+        self._memgraph_auth = (
+            self.memgraph_user or "",
+            self.memgraph_password.get_secret_value() if self.memgraph_password else "",
+        )
+
+    @property
+    def memgraph_uri(self) -> str:
+        """Memgraph connection URI (precomputed)."""
+        return self._memgraph_uri
 
     @property
     def qdrant_uri(self) -> str:
-        """Build Qdrant connection URI."""
-        return f"http://{self.qdrant_host}:{self.qdrant_port}"
+        """Qdrant connection URI (precomputed)."""
+        return self._qdrant_uri
+
+    @property
+    def memgraph_auth(self) -> tuple[str, str]:
+        """Memgraph (user, password) auth pair (precomputed)."""
+        return self._memgraph_auth
 
 
 @lru_cache
@@ -1,10 +1,34 @@
 """Egregore Dashboard - Interactive Graph Visualization."""
 
-import pandas as pd
+import asyncio
+import json
+from typing import Any
+
 import streamlit as st
-from agraph import Config, Edge, Node, agraph
 
-from src.graph_client import GraphClient, get_graph_client
+from src.graph_client import AsyncGraphClient, GraphClient, get_graph_client
+
+# Graph palette
+NODE_COLOR_BUGFIX = "#00C49A"
+NODE_COLOR_DEFAULT = "#0088FE"
+EDGE_COLOR = "#888888"
+
+
+def parse_metadata(raw: Any) -> dict[str, Any]:
+    """Decode a stored metadata payload.
+
+    Memories created via the dashboard store metadata as JSON text;
+    anything older (Python repr strings) or unparseable decodes to {}.
+    """
+    if isinstance(raw, dict):
+        return raw
+    if not raw:
+        return {}
+    try:
+        decoded = json.loads(raw)
+    except (TypeError, ValueError):
+        return {}
+    return decoded if isinstance(decoded, dict) else {}
 
 # Page configuration
 st.set_page_config(
@@ -15,7 +39,53 @@ st.set_page_config(
 )
 
 
-def init_session_state():
+# Cached read: Streamlit reruns the whole script on every interaction,
+# so this keeps widget clicks from re-querying Memgraph for data that
+# changed seconds ago at most. One fetch serves the statistics cards,
+# the graph and the list view; mutations call invalidate_view().
+# ignore is conditional: the decorator is untyped only where
+# streamlit's own type information isn't installed
+@st.cache_data(ttl=5)  # type: ignore[untyped-decorator, unused-ignore]
+def fetch_view() -> dict[str, Any]:
+    # The async client overlaps the three queries; a fresh client per
+    # call because drivers are bound to the event loop asyncio.run spins
+    # up, and the 5s cache keeps reconnects rare anyway
+    async def gather() -> dict[str, Any]:
+        async with AsyncGraphClient() as client:
+            return await client.fetch_view()
+
+    return asyncio.run(gather())
+
+
+def memory_options(memories: list[dict[str, Any]]) -> dict[str, str]:
+    """Map memory id -> truncated label for selectboxes.
+
+    Built once per distinct memory set and memoized in session state, so
+    the relationship form and the delete selector share one dict instead
+    of each slicing every memory on every rerun.
+    """
+    key = (len(memories), memories[-1].get("id") if memories else None)
+    cached: tuple[Any, dict[str, str]] | None = st.session_state.get("memory_options")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    options = {m["id"]: f"{m['data'][:50]}..." for m in memories}
+    st.session_state.memory_options = (key, options)
+    return options
+
+
+def invalidate_view() -> None:
+    """Drop every cached read after a mutation.
+
+    Clears the 5s fetch_view cache and the per-query search memo in
+    session state — without the latter, an unchanged committed query
+    would keep re-serving results that include deleted memories.
+    """
+    st.cache_data.clear()
+    st.session_state.pop("search_query", None)
+    st.session_state.pop("search_results", None)
+
+
+def init_session_state() -> None:
     """Initialize session state variables."""
     if "client" not in st.session_state:
         st.session_state.client = get_graph_client()
@@ -23,7 +93,7 @@ def init_session_state():
         st.session_state.refresh = False
 
 
-def render_header():
+def render_header() -> None:
     """Render the dashboard header."""
     col1, col2 = st.columns([6, 1])
     with col1:
@@ -31,13 +101,13 @@ def render_header():
         st.markdown("*Visualize and manage your Hive Mind memory*")
     with col2:
         if st.button("🔄 Refresh", use_container_width=True):
+            st.cache_data.clear()
             st.session_state.refresh = True
             st.rerun()
 
 
-def render_statistics(client: GraphClient):
+def render_statistics(stats: dict[str, Any]) -> None:
     """Render statistics cards."""
-    stats = client.get_statistics()
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -51,47 +121,44 @@ def render_statistics(client: GraphClient):
         st.metric("🏷️ Relation Types", stats.get("unique_relations", 0))
 
 
-def render_graph_visualization(client: GraphClient):
+def render_graph_visualization(
+    memories: list[dict[str, Any]], relationships: list[dict[str, Any]]
+) -> None:
     """Render the interactive graph visualization."""
-    st.subheader("🕸️ Memory Graph")
+    # Deferred: agraph only matters on this tab, not at startup
+    from agraph import Config, Edge, Node, agraph
 
-    # Get data
-    memories = client.get_all_memories()
-    relationships = client.get_all_relationships()
+    st.subheader("🕸️ Memory Graph")
 
     if not memories:
         st.info("No memories found. Add some memories to see the graph!")
         return
 
-    # Create nodes
-    nodes = []
-    for mem in memories:
-        node_id = mem.get("id", "unknown")
-        # Truncate data for display
-        data = mem.get("data", "")
-        label = data[:30] + "..." if len(data) > 30 else data
-
-        nodes.append(
-            Node(
-                id=node_id,
-                label=label,
-                title=data,  # Tooltip
-                size=20,
-                color="#00C49A" if "bugfix" in str(mem.get("metadata", "")) else "#0088FE",
-            )
+    # Build nodes and edges as comprehensions; labels truncate the data
+    # for display, the full text goes in the tooltip
+    nodes = [
+        Node(
+            id=mem.get("id", "unknown"),
+            label=data[:30] + "..." if len(data) > 30 else data,
+            title=data,  # Tooltip
+            size=20,
+            color=NODE_COLOR_BUGFIX
+            if parse_metadata(mem.get("metadata")).get("context") == "bugfix"
+            else NODE_COLOR_DEFAULT,
         )
-
-    # Create edges
-    edges = []
-    for rel in relationships:
-        edges.append(
-            Edge(
-                source=rel.get("source"),
-                target=rel.get("target"),
-                label=rel.get("type", "RELATED_TO"),
-                color="#888888",
-            )
+        for mem in memories
+        for data in (mem.get("data", ""),)
+    ]
+
+    edges = [
+        Edge(
+            source=rel.get("source"),
+            target=rel.get("target"),
+            label=rel.get("type", "RELATED_TO"),
+            color=EDGE_COLOR,
         )
+        for rel in relationships
+    ]
 
     # Graph configuration
     config = Config(
@@ -109,7 +176,7 @@ def render_graph_visualization(client: GraphClient):
     agraph(nodes=nodes, edges=edges, config=config)
 
 
-def render_add_memory(client: GraphClient):
+def render_add_memory(client: GraphClient) -> None:
     """Render form to add new memory."""
     st.subheader("➕ Add Memory")
 
@@ -127,7 +194,7 @@ def render_add_memory(client: GraphClient):
         submitted = st.form_submit_button("Add Memory", use_container_width=True)
 
         if submitted and data:
-            metadata = {}
+            metadata: dict[str, Any] = {}
             if context:
                 metadata["context"] = context
             if tags:
@@ -135,36 +202,36 @@ def render_add_memory(client: GraphClient):
 
             try:
                 memory_id = client.create_memory(data, metadata)
+                invalidate_view()
                 st.success(f"Memory created! ID: {memory_id[:8]}...")
                 st.session_state.refresh = True
             except Exception as e:
                 st.error(f"Error creating memory: {e}")
 
 
-def render_add_relation(client: GraphClient):
+def render_add_relation(client: GraphClient, memories: list[dict[str, Any]]) -> None:
     """Render form to add relationship."""
     st.subheader("🔗 Add Relationship")
 
-    memories = client.get_all_memories()
     if len(memories) < 2:
         st.info("Need at least 2 memories to create a relationship.")
         return
 
-    memory_options = {m["id"]: f"{m['data'][:40]}..." for m in memories}
+    options = memory_options(memories)
 
     with st.form("add_relation_form"):
         col1, col2 = st.columns(2)
         with col1:
             source_id = st.selectbox(
                 "From Memory",
-                options=list(memory_options.keys()),
-                format_func=lambda x: memory_options.get(x, x),
+                options=list(options.keys()),
+                format_func=lambda x: options.get(x, x),
             )
         with col2:
             target_id = st.selectbox(
                 "To Memory",
-                options=list(memory_options.keys()),
-                format_func=lambda x: memory_options.get(x, x),
+                options=list(options.keys()),
+                format_func=lambda x: options.get(x, x),
             )
 
         rel_type = st.selectbox(
@@ -181,6 +248,7 @@ def render_add_relation(client: GraphClient):
                 try:
                     success = client.create_relationship(source_id, target_id, rel_type)
                     if success:
+                        invalidate_view()
                         st.success("Relationship created!")
                         st.session_state.refresh = True
                     else:
@@ -189,45 +257,56 @@ def render_add_relation(client: GraphClient):
                     st.error(f"Error: {e}")
 
 
-def render_memory_list(client: GraphClient):
+def render_memory_list(client: GraphClient, memories: list[dict[str, Any]]) -> None:
     """Render the memory list table."""
+    # Deferred: pandas is only needed for this tab's table
+    import pandas as pd
+
     st.subheader("📋 Memory List")
 
-    # Search
+    # Search, memoized per query: text_input only commits on Enter/blur,
+    # so a rerun with an unchanged query (tab switches, button clicks)
+    # reuses the stored results instead of re-querying
     search_query = st.text_input("🔍 Search memories", "")
 
     if search_query:
-        memories = client.search_memories(search_query)
-    else:
-        memories = client.get_all_memories()
+        if search_query == st.session_state.get("search_query"):
+            memories = st.session_state.search_results
+        else:
+            memories = client.search_memories(search_query)
+            st.session_state.search_query = search_query
+            st.session_state.search_results = memories
 
     if not memories:
         st.info("No memories found.")
         return
 
-    # Convert to DataFrame for display
-    df_data = []
-    for mem in memories:
-        df_data.append({
-            "ID": mem.get("id", "")[:8] + "...",
-            "Content": mem.get("data", "")[:100] + "...",
-            "Created": mem.get("created_at", "")[:19],
-            "Metadata": str(mem.get("metadata", ""))[:50],
-        })
-
-    df = pd.DataFrame(df_data)
+    # Build the DataFrame from the raw records and truncate columns with
+    # vectorized string ops instead of a Python loop per row; metadata is
+    # decoded once per row and reused for both display columns
+    raw = pd.DataFrame(memories)
+    meta = raw["metadata"].map(parse_metadata)
+    df = pd.DataFrame(
+        {
+            "ID": raw["id"].fillna("").str.slice(0, 8) + "...",
+            "Content": raw["data"].fillna("").str.slice(0, 100) + "...",
+            "Created": raw["created_at"].fillna("").str.slice(0, 19),
+            "Context": meta.map(lambda m: m.get("context", "")),
+            "Tags": meta.map(lambda m: ", ".join(m.get("tags", []))),
+        }
+    )
     st.dataframe(df, use_container_width=True, hide_index=True)
 
     # Delete memory section
     st.subheader("🗑️ Delete Memory")
-    memory_options = {m["id"]: f"{m['data'][:50]}..." for m in memories}
+    options = memory_options(memories)
 
     col1, col2 = st.columns([3, 1])
     with col1:
         to_delete = st.selectbox(
             "Select memory to delete",
-            options=list(memory_options.keys()),
-            format_func=lambda x: memory_options.get(x, x),
+            options=list(options.keys()),
+            format_func=lambda x: options.get(x, x),
             key="delete_select",
         )
     with col2:
@@ -235,6 +314,7 @@ def render_memory_list(client: GraphClient):
             try:
                 success = client.delete_memory(to_delete)
                 if success:
+                    invalidate_view()
                     st.success("Memory deleted!")
                     st.session_state.refresh = True
                 else:
@@ -243,15 +323,18 @@ def render_memory_list(client: GraphClient):
                 st.error(f"Error: {e}")
 
 
-def main():
+def main() -> None:
     """Main dashboard application."""
     init_session_state()
     client = st.session_state.client
 
     render_header()
 
+    # One cached fetch feeds every section of the page
+    view = fetch_view()
+
     # Statistics
-    render_statistics(client)
+    render_statistics(view["statistics"])
 
     st.divider()
 
@@ -259,17 +342,17 @@ def main():
     tab1, tab2, tab3 = st.tabs(["🕸️ Graph View", "➕ Add Content", "📋 List View"])
 
     with tab1:
-        render_graph_visualization(client)
+        render_graph_visualization(view["memories"], view["relationships"])
 
     with tab2:
         col1, col2 = st.columns(2)
         with col1:
             render_add_memory(client)
         with col2:
-            render_add_relation(client)
+            render_add_relation(client, view["memories"])
 
     with tab3:
-        render_memory_list(client)
+        render_memory_list(client, view["memories"])
 
     # Footer
     st.divider()
@@ -1,11 +1,67 @@
 """Direct Memgraph client for dashboard operations."""
 
+import asyncio
+import json
+import time
+from collections.abc import Callable
 from typing import Any
 
-from neo4j import GraphDatabase
-
 from src.config import Settings, get_settings
 
+# How long read results stay fresh; dashboard reruns within this window
+# are served from memory instead of re-querying Memgraph
+CACHE_TTL = 5.0
+
+# Relationship types the dashboard may create. Types are interpolated
+# into Cypher (they can't be parameterized), so anything outside this
+# set is rejected instead of concatenated into the query.
+ALLOWED_RELATION_TYPES = frozenset(
+    {"RELATED_TO", "DEPENDS_ON", "FIXES", "IMPLEMENTS", "REFERENCES"}
+)
+
+_MEMORIES_QUERY = """
+MATCH (m:Memory)
+RETURN m.id as id, m.data as data, m.created_at as created_at,
+       m.metadata as metadata, labels(m) as labels
+LIMIT 1000
+"""
+
+_RELATIONSHIPS_QUERY = """
+MATCH (m1:Memory)-[r]->(m2:Memory)
+RETURN m1.id as source, m2.id as target, type(r) as type, r as properties
+LIMIT 1000
+"""
+
+_STATISTICS_QUERY = """
+MATCH (m:Memory)
+WITH count(m) as memory_count
+CALL {
+    MATCH ()-[r]->()
+    RETURN count(r) as relation_count,
+           count(DISTINCT type(r)) as unique_relations
+}
+RETURN memory_count, relation_count, unique_relations
+"""
+
+
+def _with_density(stats: dict[str, Any]) -> dict[str, Any]:
+    """Add the graph density derived from node and edge counts."""
+    n = stats.get("memory_count", 0)
+    e = stats.get("relation_count", 0)
+    stats["density"] = round(e / (n * (n - 1)) if n > 1 else 0, 4)
+    return stats
+
+
+def _records_to_dicts(result: Any) -> list[dict[str, Any]]:
+    """Materialize a result set as dicts.
+
+    All records of a query share one key tuple, so it is resolved once
+    and zipped with each record's values instead of letting dict(record)
+    redo the key lookup per row.
+    """
+    keys = result.keys()
+    return [dict(zip(keys, record.values(), strict=True)) for record in result]
+
 
 class GraphClient:
     """Client for direct Memgraph graph operations."""
@@ -18,22 +74,73 @@ class GraphClient:
         """
         self.settings = settings or get_settings()
         self._driver = None
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._indexes_ensured = False
+        # None until the first search decides whether the text-search
+        # module is usable on this server
+        self._text_search_ok: bool | None = None
+
+    def _cached(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return the cached result for key, refreshing after CACHE_TTL."""
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < CACHE_TTL:
+            return entry[1]
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
+
+    def _invalidate(self) -> None:
+        """Drop cached reads after a write so they can't go stale."""
+        self._cache.clear()
 
     @property
-    def driver(self) -> GraphDatabase.driver:
-        """Lazy initialization of Neo4j driver."""
+    def driver(self) -> Any:
+        """Lazy initialization of Neo4j driver.
+
+        The neo4j import lives here so importing this module (e.g. from
+        the CLI or tests) doesn't pay the driver's import cost until a
+        connection is actually needed.
+        """
         if self._driver is None:
+            from neo4j import GraphDatabase
+
             self._driver = GraphDatabase.driver(
                 self.settings.memgraph_uri,
-                auth=(
-                    self.settings.memgraph_user or "",
-                    self.settings.memgraph_password.get_secret_value()
-                    if self.settings.memgraph_password
-                    else "",
-                ),
+                auth=self.settings.memgraph_auth,
+                max_connection_pool_size=10,
+                connection_acquisition_timeout=10,
             )
+            self.ensure_indexes()
         return self._driver
 
+    def ensure_indexes(self) -> None:
+        """Create the Memory(id) index if it doesn't exist yet.
+
+        Lookups by id (relationship creation, deletion) otherwise scan
+        every Memory node. Runs once per client; index creation is
+        idempotent in Memgraph.
+        """
+        if self._indexes_ensured:
+            return
+        # Set the flag first: ensure_indexes is called from the driver
+        # property, and the session below re-enters it
+        self._indexes_ensured = True
+        try:
+            with self.driver.session() as session:
+                session.run("CREATE INDEX ON :Memory(id)")
+        except Exception:
+            # Index may already exist, or the server predates the syntax;
+            # queries still work without it
+            pass
+        try:
+            with self.driver.session() as session:
+                session.run("CREATE TEXT INDEX memory_data ON :Memory")
+        except Exception:
+            # Text search is an optional Memgraph module; search falls
+            # back to a CONTAINS scan without it
+            self._text_search_ok = False
+
     def close(self) -> None:
         """Close the driver connection."""
         if self._driver:
@@ -41,30 +148,55 @@ class GraphClient:
             self._driver = None
 
     def get_all_memories(self) -> list[dict[str, Any]]:
-        """Get all memory nodes from the graph."""
-        query = """
-        MATCH (m:Memory)
-        RETURN m.id as id, m.data as data, m.created_at as created_at,
-               m.metadata as metadata, labels(m) as labels
-        LIMIT 1000
-        """
-        with self.driver.session() as session:
-            result = session.run(query)
-            return [dict(record) for record in result]
+        """Get all memory nodes from the graph (cached for CACHE_TTL)."""
+
+        def fetch() -> list[dict[str, Any]]:
+            with self.driver.session() as session:
+                result = session.run(_MEMORIES_QUERY)
+                return _records_to_dicts(result)
+
+        return self._cached("memories", fetch)
 
     def get_all_relationships(self) -> list[dict[str, Any]]:
-        """Get all relationships between memories."""
-        query = """
-        MATCH (m1:Memory)-[r]->(m2:Memory)
-        RETURN m1.id as source, m2.id as target, type(r) as type, r as properties
-        LIMIT 1000
+        """Get all relationships between memories (cached for CACHE_TTL)."""
+
+        def fetch() -> list[dict[str, Any]]:
+            with self.driver.session() as session:
+                result = session.run(_RELATIONSHIPS_QUERY)
+                return _records_to_dicts(result)
+
+        return self._cached("relationships", fetch)
+
+    def fetch_view(self) -> dict[str, Any]:
+        """Fetch memories, relationships and statistics on one session.
+
+        The dashboard needs all three on every rerun; running them over a
+        single session acquires one pooled connection per page load
+        instead of three. Cached for CACHE_TTL like the single readers.
+
+        Returns:
+            Dict with "memories", "relationships" and "statistics" keys
         """
-        with self.driver.session() as session:
-            result = session.run(query)
-            return [dict(record) for record in result]
+
+        def fetch() -> dict[str, Any]:
+            with self.driver.session() as session:
+                memories = _records_to_dicts(session.run(_MEMORIES_QUERY))
+                relationships = _records_to_dicts(session.run(_RELATIONSHIPS_QUERY))
+                stats = _with_density(dict(session.run(_STATISTICS_QUERY).single()))
+            return {
+                "memories": memories,
+                "relationships": relationships,
+                "statistics": stats,
+            }
+
+        return self._cached("view", fetch)
 
     def create_memory(self, data: str, metadata: dict | None = None) -> str:
-        """Create a new memory node."""
+        """Create a new memory node.
+
+        Metadata is stored as JSON text, so consumers can decode it with
+        json.loads instead of scraping a Python repr string.
+        """
         import uuid
         from datetime import datetime
 
@@ -87,14 +219,23 @@ class GraphClient:
                 id=memory_id,
                 data=data,
                 created_at=datetime.now().isoformat(),
-                metadata=str(metadata),
+                metadata=json.dumps(metadata, separators=(",", ":")),
             )
-            return result.single()["id"]
+            created = result.single()["id"]
+        self._invalidate()
+        return created
 
     def create_relationship(
         self, source_id: str, target_id: str, rel_type: str = "RELATED_TO"
     ) -> bool:
-        """Create a relationship between two memories."""
+        """Create a relationship between two memories.
+
+        Raises:
+            ValueError: If rel_type is not in ALLOWED_RELATION_TYPES.
+        """
+        if rel_type not in ALLOWED_RELATION_TYPES:
+            raise ValueError(f"Unsupported relationship type: {rel_type!r}")
+
         query = f"""
         MATCH (m1:Memory {{id: $source_id}})
         MATCH (m2:Memory {{id: $target_id}})
@@ -104,7 +245,9 @@ class GraphClient:
 
         with self.driver.session() as session:
             result = session.run(query, source_id=source_id, target_id=target_id)
-            return result.single() is not None
+            created = result.single() is not None
+        self._invalidate()
+        return created
 
     def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory node and its relationships."""
@@ -116,11 +259,25 @@ class GraphClient:
 
         with self.driver.session() as session:
             result = session.run(query, id=memory_id)
-            return result.single()["deleted"] > 0
+            deleted = result.single()["deleted"] > 0
+        self._invalidate()
+        return deleted
 
     def search_memories(self, query_text: str) -> list[dict[str, Any]]:
-        """Search memories by content."""
-        query = """
+        """Search memories by content.
+
+        Uses Memgraph's text-search module (indexed lookup on the
+        memory_data text index) when available; the first failure flips
+        to a CONTAINS scan permanently so later searches don't pay the
+        failed attempt again.
+        """
+        text_query = """
+        CALL text_search.search('memory_data', $query) YIELD node
+        RETURN node.id as id, node.data as data, node.created_at as created_at,
+               node.metadata as metadata
+        LIMIT 100
+        """
+        scan_query = """
         MATCH (m:Memory)
         WHERE m.data CONTAINS $query
         RETURN m.id as id, m.data as data, m.created_at as created_at,
@@ -128,30 +285,119 @@ class GraphClient:
         LIMIT 100
         """
 
+        if self._text_search_ok is not False:
+            try:
+                with self.driver.session() as session:
+                    result = session.run(text_query, query=f"data.data:{query_text}")
+                    records = _records_to_dicts(result)
+                self._text_search_ok = True
+                return records
+            except Exception:
+                self._text_search_ok = False
+
         with self.driver.session() as session:
-            result = session.run(query, query=query_text)
-            return [dict(record) for record in result]
+            result = session.run(scan_query, query=query_text)
+            return _records_to_dicts(result)
 
     def get_statistics(self) -> dict[str, int]:
-        """Get graph statistics."""
-        queries = {
-            "memory_count": "MATCH (m:Memory) RETURN count(m) as count",
-            "relation_count": "MATCH ()-[r]->() RETURN count(r) as count",
-            "unique_relations": "MATCH ()-[r]->() RETURN count(DISTINCT type(r)) as count",
-        }
+        """Get graph statistics.
 
-        stats = {}
-        with self.driver.session() as session:
-            for key, query in queries.items():
-                result = session.run(query)
-                stats[key] = result.single()["count"]
+        All three counts come back from one round trip: the relationship
+        aggregates run in a CALL subquery next to the node count instead
+        of three separate queries, each paying its own network hop.
+        """
+
+        def _stats(tx: Any) -> dict[str, int]:
+            return dict(tx.run(_STATISTICS_QUERY).single())
+
+        def fetch() -> dict[str, int]:
+            with self.driver.session() as session:
+                return _with_density(session.execute_read(_stats))
+
+        return self._cached("statistics", fetch)
+
+
+class AsyncGraphClient:
+    """Async Memgraph client for concurrent dashboard reads.
+
+    The sync GraphClient runs the view queries back to back; this client
+    issues them with asyncio.gather so the three round trips overlap.
+    Drivers are bound to the event loop that created them, so use one
+    instance per asyncio.run() — typically via ``async with``.
+    """
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        """Initialize async graph client.
+
+        Args:
+            settings: Configuration settings
+        """
+        self.settings = settings or get_settings()
+        self._driver = None
 
-        # Calculate density
-        n = stats.get("memory_count", 0)
-        e = stats.get("relation_count", 0)
-        stats["density"] = round(e / (n * (n - 1)) if n > 1 else 0, 4)
+    @property
+    def driver(self) -> Any:
+        """Lazy initialization of the async Neo4j driver."""
+        if self._driver is None:
+            from neo4j import AsyncGraphDatabase
 
-        return stats
+            self._driver = AsyncGraphDatabase.driver(
+                self.settings.memgraph_uri,
+                auth=self.settings.memgraph_auth,
+                max_connection_pool_size=10,
+                connection_acquisition_timeout=10,
+            )
+        return self._driver
+
+    async def __aenter__(self) -> "AsyncGraphClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the driver connection."""
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+
+    async def get_all_memories(self) -> list[dict[str, Any]]:
+        """Get all memory nodes from the graph."""
+        async with self.driver.session() as session:
+            result = await session.run(_MEMORIES_QUERY)
+            keys = result.keys()
+            return [dict(zip(keys, record.values(), strict=True)) async for record in result]
+
+    async def get_all_relationships(self) -> list[dict[str, Any]]:
+        """Get all relationships between memories."""
+        async with self.driver.session() as session:
+            result = await session.run(_RELATIONSHIPS_QUERY)
+            keys = result.keys()
+            return [dict(zip(keys, record.values(), strict=True)) async for record in result]
+
+    async def get_statistics(self) -> dict[str, int]:
+        """Get graph statistics in one round trip."""
+        async with self.driver.session() as session:
+            result = await session.run(_STATISTICS_QUERY)
+            record = await result.single()
+            return _with_density(dict(record))
+
+    async def fetch_view(self) -> dict[str, Any]:
+        """Fetch memories, relationships and statistics concurrently.
+
+        Returns:
+            Dict with "memories", "relationships" and "statistics" keys
+        """
+        memories, relationships, statistics = await asyncio.gather(
+            self.get_all_memories(),
+            self.get_all_relationships(),
+            self.get_statistics(),
+        )
+        return {
+            "memories": memories,
+            "relationships": relationships,
+            "statistics": statistics,
+        }
 
 
 # Singleton instance
@@ -1,18 +1,332 @@
 """Mem0 client wrapper for Egregore."""
 
-from typing import Any
+import contextlib
+import copy
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, NamedTuple
 
+import numpy as np
 from mem0 import Memory
 from mem0.configs.base import (
-    MemoryConfig,
-    VectorStoreConfig,
+    EmbedderConfig,
     GraphStoreConfig,
     LlmConfig,
-    EmbedderConfig,
+    MemoryConfig,
+    VectorStoreConfig,
 )
 
 from src.config import Settings, get_settings
 
+# One keep-alive connection pool for the whole process. Shared by both
+# Mem0 clients' embedding/LLM traffic so calls after the first skip the
+# TCP/TLS handshake, and HTTP/2 lets the recall batcher's parallel
+# requests multiplex one socket. Sync (not Async) because Mem0's call
+# paths are synchronous and run inside the server's thread pool.
+_http_client: Any | None = None
+
+
+def _get_http_client() -> Any | None:
+    """Lazily build the shared httpx client; None if httpx is missing."""
+    global _http_client
+    if _http_client is None:
+        try:
+            import httpx
+        except ImportError:
+            return None
+        limits = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+        try:
+            _http_client = httpx.Client(http2=True, limits=limits, timeout=30)
+        except ImportError:
+            # h2 not installed; keep-alive still beats per-call sockets
+            _http_client = httpx.Client(limits=limits, timeout=30)
+    return _http_client
+
+
+# Entries kept in the exact-match recall cache; payloads are small
+# result lists so the bound is KBs, not MBs
+_EXACT_CACHE_SIZE = 1024
+
+# Shared pool for fanning out per-text embedding calls in embed_batch;
+# sized for I/O-bound HTTP requests, not CPU work
+_EMBED_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Payload keys Mem0 stores alongside user metadata in Qdrant; stripped
+# before the payload is surfaced as a result's metadata
+_PAYLOAD_INTERNAL_KEYS = frozenset(
+    {"data", "hash", "created_at", "updated_at", "user_id", "agent_id", "run_id"}
+)
+
+
+class HealthStatus(NamedTuple):
+    """Connectivity status of the memory stores."""
+
+    vector_store: bool
+    graph_store: bool
+    error: str | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.vector_store and self.graph_store
+
+
+def _pack_results(results: Any) -> tuple[str, Any]:
+    """Transpose a uniform recall payload into columns for caching.
+
+    Mem0 search results arrive as {"results": [...]} dicts whose items
+    share one key set (id, memory, score, metadata plus bookkeeping
+    like hash and created_at). When a payload matches that shape — with
+    or without the wrapper — its items are stored as per-key columns:
+    numeric scores collapse into a single float64 array and every other
+    key into a flat list, so a warm cache holds a handful of columns
+    instead of thousands of tiny dicts. Anything else is kept verbatim
+    as ("raw", deepcopy).
+    """
+    wrapper = None
+    items = results
+    if isinstance(results, dict) and isinstance(results.get("results"), list):
+        wrapper = {k: v for k, v in results.items() if k != "results"}
+        items = results["results"]
+    if isinstance(items, list) and items and all(isinstance(m, dict) for m in items):
+        keys = list(items[0])
+        if keys and all(list(m) == keys for m in items[1:]):
+            columns: list[Any] = []
+            for key in keys:
+                values = [m[key] for m in items]
+                if key == "score" and all(
+                    isinstance(v, int | float) and not isinstance(v, bool) for v in values
+                ):
+                    # float64 so scores round-trip to the exact Python float
+                    columns.append(np.array(values, dtype=np.float64))
+                else:
+                    columns.append(copy.deepcopy(values))
+            return ("cols", (keys, columns, copy.deepcopy(wrapper)))
+    return ("raw", copy.deepcopy(results))
+
+
+def _unpack_results(payload: tuple[str, Any]) -> Any:
+    """Rebuild the outward-facing payload from a cached entry."""
+    kind, data = payload
+    if kind == "raw":
+        return copy.deepcopy(data)
+    keys, columns, wrapper = data
+    items = [
+        {
+            key: float(value) if isinstance(value, np.floating) else copy.deepcopy(value)
+            for key, value in zip(keys, row, strict=True)
+        }
+        for row in zip(*columns, strict=True)
+    ]
+    if wrapper is None:
+        return items
+    rebuilt = copy.deepcopy(wrapper)
+    rebuilt["results"] = items
+    return rebuilt
+
+
+def _top_memory_id(results: Any) -> Any:
+    """Id of the highest-ranked memory in a recall payload."""
+    items = results.get("results", []) if isinstance(results, dict) else results
+    if items:
+        return items[0].get("id")
+    return None
+
+
+class SemanticCache:
+    """Query-level similarity cache for recall results.
+
+    Keyed by query embedding: a lookup returns the results cached for
+    the closest earlier query when its cosine similarity clears the
+    threshold and the entry is still fresh. Entries are namespaced by
+    user_id so memory isolation survives caching, and each namespace is
+    a fixed-size ring of vectors scored with one NumPy inner product
+    over a contiguous float32 matrix — the same exact-scan a flat
+    inner-product index (e.g. FAISS IndexFlatIP) performs, without the
+    index bookkeeping that ring overwrites would invalidate.
+
+    The hit threshold adapts per region of embedding space: cached
+    queries are partitioned across a small set of online-updated
+    centroids, each with its own similarity threshold. A sampled
+    fraction of hits is shadow-verified against the real search, and the
+    region's threshold is nudged up on a mismatch and relaxed on a
+    match, so dense regions can cache aggressively while volatile ones
+    stay conservative.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        threshold: float = 0.95,
+        ttl: float = 300.0,
+        regions: int = 16,
+        verify_rate: float = 0.02,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: Entries kept per user namespace
+            threshold: Starting similarity threshold per region
+            ttl: Entry lifetime in seconds
+            regions: Number of centroid regions per namespace
+            verify_rate: Fraction of hits shadow-verified downstream
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self.regions = regions
+        self.verify_rate = verify_rate
+        # Bounds and step for the per-region threshold updates
+        self.threshold_floor = max(threshold - 0.05, 0.0)
+        self.threshold_ceil = 0.999
+        self.threshold_step = 0.2
+        self._spaces: dict[str, dict[str, Any]] = {}
+        # One lock for all namespaces: scoring writes into each space's
+        # shared sims buffer and NumPy releases the GIL mid-dot, so
+        # unguarded concurrent lookups corrupt each other's scores
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+    def _locate(
+        self, user_id: str, embedding: list[float], limit: int
+    ) -> tuple[str, Any] | None:
+        """Find the cached payload for the nearest fresh query, if any."""
+        with self._lock:
+            space = self._spaces.get(user_id)
+            if space is None or space["count"] == 0:
+                return None
+
+            vec = self._normalize(embedding)
+            count = space["count"]
+            # Score into the preallocated buffer so lookups allocate
+            # nothing; the lock keeps concurrent lookups from scoring
+            # into the same buffer
+            sims = np.dot(space["vectors"][:count], vec, out=space["sims"][:count])
+            best = int(np.argmax(sims))
+            region = self._nearest_region(space, vec)
+            if sims[best] < space["thresholds"][region]:
+                return None
+            if time.monotonic() - space["times"][best] > self.ttl:
+                return None
+            entry: tuple[int, tuple[str, Any]] = space["payloads"][best]
+            cached_limit, payload = entry
+            if cached_limit != limit:
+                return None
+            return payload
+
+    def lookup(self, user_id: str, embedding: list[float], limit: int) -> Any | None:
+        """Return cached results for the nearest query, or None on miss.
+
+        Rebuilds item dicts from the columnar entry (copies throughout,
+        so callers can't mutate the cached data).
+        """
+        payload = self._locate(user_id, embedding, limit)
+        if payload is None:
+            return None
+        return _unpack_results(payload)
+
+    def insert(self, user_id: str, embedding: list[float], limit: int, results: Any) -> None:
+        """Cache the results for a query embedding."""
+        vec = self._normalize(embedding)
+        payload = (limit, _pack_results(results))
+        with self._lock:
+            space = self._spaces.get(user_id)
+            if space is None:
+                space = {
+                    "vectors": np.zeros((self.capacity, vec.shape[0]), dtype=np.float32),
+                    "sims": np.zeros(self.capacity, dtype=np.float32),
+                    "times": np.zeros(self.capacity),
+                    "payloads": [None] * self.capacity,
+                    "count": 0,
+                    "head": 0,
+                    "centroids": np.zeros((self.regions, vec.shape[0]), dtype=np.float32),
+                    "centroid_counts": np.zeros(self.regions, dtype=np.int64),
+                    "thresholds": np.full(self.regions, self.threshold, dtype=np.float32),
+                }
+                self._spaces[user_id] = space
+
+            self._update_region(space, vec)
+            i = space["head"]
+            space["vectors"][i] = vec
+            space["times"][i] = time.monotonic()
+            space["payloads"][i] = payload
+            space["head"] = (i + 1) % self.capacity
+            space["count"] = min(space["count"] + 1, self.capacity)
+
+    def _nearest_region(self, space: dict[str, Any], vec: np.ndarray) -> int:
+        """Index of the centroid region a normalized vector falls into."""
+        counts = space["centroid_counts"]
+        used = counts > 0
+        if not used.any():
+            return 0
+        sims = space["centroids"] @ vec
+        sims[~used] = -np.inf
+        return int(np.argmax(sims))
+
+    def _update_region(self, space: dict[str, Any], vec: np.ndarray) -> None:
+        """Assign a vector to a region, seeding or moving its centroid.
+
+        Online k-means: empty regions are seeded with the first vectors,
+        then each assignment pulls its centroid toward the new vector by
+        1/count so regions settle as the namespace warms up.
+        """
+        counts = space["centroid_counts"]
+        empty = np.flatnonzero(counts == 0)
+        region = int(empty[0]) if empty.size else self._nearest_region(space, vec)
+        counts[region] += 1
+        centroid = space["centroids"][region]
+        centroid += (vec - centroid) / counts[region]
+        norm = float(np.linalg.norm(centroid))
+        if norm:
+            centroid /= norm
+
+    def should_verify(self) -> bool:
+        """Whether this hit should be shadow-verified by the caller."""
+        return random.random() < self.verify_rate
+
+    def report_verification(
+        self,
+        user_id: str,
+        embedding: list[float],
+        cached: Any,
+        actual: Any,
+    ) -> None:
+        """Adapt the hit region's threshold from a shadow-verified hit.
+
+        A mismatch between the cached and true top results pushes the
+        region's threshold toward the ceiling; a match relaxes it toward
+        the floor, both by an exponentially-weighted step.
+        """
+        with self._lock:
+            space = self._spaces.get(user_id)
+            if space is None:
+                return
+            vec = self._normalize(embedding)
+            region = self._nearest_region(space, vec)
+            thresholds = space["thresholds"]
+            tau = float(thresholds[region])
+            if _top_memory_id(cached) == _top_memory_id(actual):
+                thresholds[region] = tau - self.threshold_step * (tau - self.threshold_floor)
+            else:
+                thresholds[region] = tau + self.threshold_step * (self.threshold_ceil - tau)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached entries (e.g. after a write)."""
+        with self._lock:
+            self._spaces.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._spaces.clear()
+
 
 class EgregoreMemory:
     """Wrapper around Mem0 client for Egregore operations."""
@@ -25,18 +339,119 @@ class EgregoreMemory:
         """
         self.settings = settings or get_settings()
         self._client: Memory | None = None
+        self._recall_client: Memory | None = None
+        self._client_lock = threading.Lock()
+        self._semantic_cache = SemanticCache()
+        # Exact-match recall cache: dicts iterate in insertion order, so
+        # re-inserting on hit gives LRU eviction without an OrderedDict.
+        # Keys carry a per-user epoch that store() bumps, so stale
+        # entries simply stop matching and age out of the ring.
+        self._exact_cache: dict[tuple[str, int, str, int], dict[str, Any]] = {}
+        self._store_epochs: dict[str, int] = {}
 
     @property
     def client(self) -> Memory:
-        """Lazy initialization of Mem0 client."""
+        """Lazy initialization of Mem0 client.
+
+        Double-checked under a lock: concurrent tool threads hitting a
+        cold client would otherwise each boot Mem0 (embedder handshake
+        plus Qdrant collection check).
+        """
         if self._client is None:
-            config = self._build_config()
-            self._client = Memory(config=config)
+            with self._client_lock:
+                if self._client is None:
+                    client = Memory(config=self._config)
+                    self._tune_http(client)
+                    self._ensure_quantization(client)
+                    self._client = client
         return self._client
 
-    def _build_config(self) -> MemoryConfig:
-        """Build Mem0 configuration."""
+    @staticmethod
+    def _ensure_quantization(client: Memory) -> None:
+        """Enable int8 scalar quantization on the client's collection.
+
+        Mem0's vector-store config doesn't pass quantization settings
+        through, so after it creates the collection this updates it
+        directly: Qdrant keeps an always-in-RAM int8 copy of each vector
+        (quantile 0.99) and scans that instead of the float32 originals,
+        plus on-disk payload storage. Best effort — a Qdrant server that
+        predates these options just keeps serving unquantized.
+        """
+        store = getattr(client, "vector_store", None)
+        if store is None:
+            return
+        qdrant = getattr(store, "client", None)
+        if qdrant is None or not hasattr(qdrant, "update_collection"):
+            return
+        from qdrant_client import models
+
+        with contextlib.suppress(Exception):
+            qdrant.update_collection(
+                collection_name=store.collection_name,
+                quantization_config=models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+                    )
+                ),
+                collection_params=models.CollectionParamsDiff(on_disk_payload=True),
+            )
+
+    def _tune_http(self, client: Memory) -> None:
+        """Route a Mem0 client's OpenAI traffic over the shared pool.
+
+        The OpenAI SDK otherwise builds a private client with default
+        limits per Memory instance; rebuilding it with the shared
+        keep-alive pool removes the TLS handshake from every embedding
+        and LLM call after the first.
+        """
+        http_client = _get_http_client()
+        if http_client is None:
+            return
+        try:
+            from openai import OpenAI
+        except ImportError:
+            return
+        api_key = self.settings.embedding_api_key.get_secret_value()
+        for component in (
+            getattr(client, "embedding_model", None),
+            getattr(client, "llm", None),
+        ):
+            if component is not None and isinstance(
+                getattr(component, "client", None), OpenAI
+            ):
+                component.client = OpenAI(api_key=api_key, http_client=http_client)
+
+    @property
+    def recall_client(self) -> Memory:
+        """Mem0 client serving the recall hot path.
+
+        When settings.recall_embedder names a local sentence-transformers
+        model, recalls go through a light client that embeds in-process
+        (no API round trip or rate limit) against a parallel 384-dim
+        collection; the API-embedding client keeps serving the store
+        path. Without the setting this is just the regular client.
+        """
+        if not self.settings.recall_embedder:
+            return self.client
+        if self._recall_client is None:
+            with self._client_lock:
+                if self._recall_client is None:
+                    client = Memory(config=self._recall_config)
+                    self._tune_http(client)
+                    self._ensure_quantization(client)
+                    self._recall_client = client
+        return self._recall_client
+
+    @cached_property
+    def _config(self) -> MemoryConfig:
+        """Mem0 configuration, built once per instance.
+
+        The API key is materialized from its SecretStr exactly once here
+        and referenced as a local, instead of unwrapping the plaintext
+        secret per config section.
+        """
         provider = self.settings.embedding_provider.value
+        api_key = self.settings.embedding_api_key.get_secret_value()
 
         # Use kuzu for graph store as it doesn't require authentication
         # TODO: Switch to memgraph once authentication is configured
@@ -48,6 +463,7 @@ class EgregoreMemory:
                     "host": self.settings.qdrant_host,
                     "port": self.settings.qdrant_port,
                     "embedding_model_dims": 1536,  # OpenAI default
+                    "on_disk": True,
                 },
             ),
             graph_store=GraphStoreConfig(
@@ -59,37 +475,210 @@ class EgregoreMemory:
             llm=LlmConfig(
                 provider=provider,
                 config={
-                    "api_key": self.settings.embedding_api_key.get_secret_value(),
+                    "api_key": api_key,
                     "model": "gpt-4o-mini" if provider == "openai" else "gemini-pro",
                 },
             ),
             embedder=EmbedderConfig(
                 provider=provider,
                 config={
-                    "api_key": self.settings.embedding_api_key.get_secret_value(),
-                    "model": self.settings.embedding_model if provider == "openai" else "models/embedding-001",
+                    "api_key": api_key,
+                    "model": (
+                        self.settings.embedding_model
+                        if provider == "openai"
+                        else "models/embedding-001"
+                    ),
                 },
             ),
         )
 
-    def recall(self, query: str, limit: int = 5, user_id: str = "egregore") -> list[dict[str, Any]]:
+    @cached_property
+    def _recall_config(self) -> MemoryConfig:
+        """Light Mem0 configuration for the recall path, built once.
+
+        Same stores as the main config, but embeddings come from the
+        local sentence-transformers model named by settings.recall_embedder
+        and land in a parallel collection sized for its 384-dim vectors.
+        """
+        base = self._config
+        return MemoryConfig(
+            vector_store=VectorStoreConfig(
+                provider="qdrant",
+                config={
+                    "collection_name": f"{self.settings.instance_name}_recall",
+                    "host": self.settings.qdrant_host,
+                    "port": self.settings.qdrant_port,
+                    "embedding_model_dims": 384,  # MiniLM-class models
+                    "on_disk": True,
+                },
+            ),
+            graph_store=base.graph_store,
+            llm=base.llm,
+            embedder=EmbedderConfig(
+                provider="huggingface",
+                config={"model": self.settings.recall_embedder},
+            ),
+        )
+
+    def recall(
+        self,
+        query: str,
+        limit: int = 5,
+        user_id: str = "egregore",
+        no_cache: bool = False,
+    ) -> dict[str, Any]:
         """Search for memories matching the query.
 
+        Repeated identical queries are answered from an exact-match LRU
+        (a dict lookup, no embedding needed); near-duplicates fall
+        through to the semantic cache, where the query embedding is
+        compared against recent queries and a close-enough, still-fresh
+        match skips the Qdrant search entirely.
+
         Args:
             query: Search query string
             limit: Maximum number of results to return
             user_id: User ID for memory isolation (default: "egregore")
+            no_cache: Bypass the semantic cache for this call
 
         Returns:
-            List of matching memory entries
+            Mem0 search payload: {"results": [...]} plus graph relations
         """
-        results = self.client.search(
+        key = (query, limit, user_id, self._store_epochs.get(user_id, 0))
+        if not no_cache:
+            # pop-then-reinsert touches the entry to the MRU end of the
+            # insertion order; pop(key, None) tolerates a concurrent
+            # same-key hit that already removed it
+            cached = self._exact_cache.pop(key, None)
+            if cached is not None:
+                self._exact_cache[key] = cached
+                return copy.deepcopy(cached)
+
+        embedding: list[float] | None = None
+        if not no_cache:
+            try:
+                embedding = self.embed(query)
+            except Exception:
+                embedding = None
+            if embedding is not None:
+                hit: dict[str, Any] | None = self._semantic_cache.lookup(
+                    user_id, embedding, limit
+                )
+                if hit is not None:
+                    if not self._semantic_cache.should_verify():
+                        self._remember_exact(key, hit)
+                        return hit
+                    # Shadow-verify a sampled fraction of hits so the
+                    # region thresholds track reality; serve the fresh
+                    # results since we paid for them anyway
+                    results: dict[str, Any] = self.recall_client.search(
+                        query=query, limit=limit, user_id=user_id
+                    )
+                    self._semantic_cache.report_verification(
+                        user_id, embedding, hit, results
+                    )
+                    self._semantic_cache.insert(user_id, embedding, limit, results)
+                    self._remember_exact(key, results)
+                    return results
+
+        results = self.recall_client.search(
             query=query,
             limit=limit,
             user_id=user_id,
         )
+
+        if embedding is not None:
+            self._semantic_cache.insert(user_id, embedding, limit, results)
+        if not no_cache:
+            self._remember_exact(key, results)
         return results
 
+    def _remember_exact(self, key: tuple[str, int, str, int], results: dict[str, Any]) -> None:
+        """Cache results under an exact (query, limit, user, epoch) key."""
+        self._exact_cache[key] = copy.deepcopy(results)
+        if len(self._exact_cache) > _EXACT_CACHE_SIZE:
+            # Evict the LRU entry (front of the insertion order); a
+            # concurrent touch or eviction may beat us to it
+            with contextlib.suppress(StopIteration, RuntimeError):
+                self._exact_cache.pop(next(iter(self._exact_cache)), None)
+
+    def recall_many(
+        self,
+        queries: list[str],
+        limit: int = 5,
+        user_id: str = "egregore",
+    ) -> list[dict[str, Any]]:
+        """Run several recalls as one batched vector-store search.
+
+        Bypasses Mem0's per-call path: all queries are embedded up
+        front, then submitted to Qdrant in a single query_batch_points
+        call, so N concurrent recalls pay one HTTP round trip instead
+        of N. Falls back to sequential recall when the underlying store
+        doesn't expose a Qdrant client.
+
+        Args:
+            queries: Search query strings
+            limit: Maximum results per query
+            user_id: User ID for memory isolation (default: "egregore")
+
+        Returns:
+            One ``{"results": [...]}`` payload per query, in order,
+            matching the shape recall returns
+        """
+        store = self.recall_client.vector_store
+        qdrant = getattr(store, "client", None)
+        if qdrant is None or not hasattr(qdrant, "query_batch_points"):
+            return [self.recall(q, limit=limit, user_id=user_id) for q in queries]
+
+        from qdrant_client import models
+
+        vectors = self.embed_batch(queries)
+        user_filter = models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="user_id", match=models.MatchValue(value=user_id)
+                )
+            ]
+        )
+        # Scan the int8 copies but re-score a 2x oversampled candidate
+        # set against the original float32 vectors
+        params = models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True, oversampling=2.0
+            )
+        )
+        requests = [
+            models.QueryRequest(
+                query=vector,
+                limit=limit,
+                filter=user_filter,
+                with_payload=True,
+                params=params,
+            )
+            for vector in vectors
+        ]
+        responses = qdrant.query_batch_points(
+            collection_name=store.collection_name, requests=requests
+        )
+        return [
+            {
+                "results": [
+                    {
+                        "id": point.id,
+                        "memory": (point.payload or {}).get("data"),
+                        "score": point.score,
+                        "metadata": {
+                            k: v
+                            for k, v in (point.payload or {}).items()
+                            if k not in _PAYLOAD_INTERNAL_KEYS
+                        },
+                    }
+                    for point in response.points
+                ]
+            }
+            for response in responses
+        ]
+
     def store(
         self,
         data: str,
@@ -106,35 +695,81 @@ class EgregoreMemory:
         Returns:
             Storage result with memory IDs
         """
-        result = self.client.add(
+        result: dict[str, Any] = self.client.add(
             data,
             metadata=metadata or {},
             user_id=user_id,
         )
+        if self.settings.recall_embedder:
+            # Mirror the raw memory into the recall collection without a
+            # second LLM pass so the light client can find it
+            self.recall_client.add(
+                data, metadata=metadata or {}, user_id=user_id, infer=False
+            )
+        # New memories can change what repeated and near-duplicate
+        # queries should see: bump the user's epoch (old exact entries
+        # stop matching and age out) and drop their semantic namespace
+        self._store_epochs[user_id] = self._store_epochs.get(user_id, 0) + 1
+        self._semantic_cache.invalidate(user_id)
         return result
 
-    def health_check(self) -> dict[str, bool]:
+    def embed(self, text: str) -> list[float]:
+        """Embed text with the recall-path embedding model.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector as a list of floats
+        """
+        embedding: list[float] = self.recall_client.embedding_model.embed(text)
+        return embedding
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts concurrently.
+
+        Each text still costs one provider call, but the calls run in
+        parallel on a shared pool, so a batch takes roughly one
+        round trip instead of N.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding vector per input text, in order
+        """
+        if len(texts) <= 1:
+            return [self.embed(text) for text in texts]
+        return list(_EMBED_POOL.map(self.embed, texts))
+
+    def health_check(self) -> HealthStatus:
         """Check connectivity to memory stores.
 
         Returns:
-            Dictionary with health status of each component
+            HealthStatus with per-component flags and an optional error
         """
         # Basic connectivity check through a simple operation
         try:
             # Try to search (will fail if stores are down)
             self.client.search("health_check", limit=1, user_id="health_check")
-            return {"vector_store": True, "graph_store": True}
+            return HealthStatus(vector_store=True, graph_store=True)
         except Exception as e:
-            return {"vector_store": False, "graph_store": False, "error": str(e)}
+            return HealthStatus(vector_store=False, graph_store=False, error=str(e))
 
 
 # Singleton instance
 _egregore_memory: EgregoreMemory | None = None
+_memory_lock = threading.Lock()
 
 
 def get_memory() -> EgregoreMemory:
-    """Get or create the singleton EgregoreMemory instance."""
+    """Get or create the singleton EgregoreMemory instance.
+
+    Double-checked so concurrent cold callers can't each build one.
+    """
     global _egregore_memory
     if _egregore_memory is None:
-        _egregore_memory = EgregoreMemory()
+        with _memory_lock:
+            if _egregore_memory is None:
+                _egregore_memory = EgregoreMemory()
     return _egregore_memory
@@ -0,0 +1,95 @@
+"""Atomic PID file acquisition with advisory locking."""
+
+from __future__ import annotations
+
+import fcntl
+import os
+from pathlib import Path
+
+
+class AlreadyRunningError(RuntimeError):
+    """Raised when the PID file is held by a live process."""
+
+    def __init__(self, pid: int) -> None:
+        super().__init__(f"PID file held by running process {pid}")
+        self.pid = pid
+
+
+def _alive(pid: int) -> bool:
+    """Check process liveness with a zero signal."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_pid(fd: int) -> int | None:
+    """Read the PID stored in an open PID file, if any."""
+    os.lseek(fd, 0, os.SEEK_SET)
+    raw = os.read(fd, 64).strip()
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+def acquire(path: Path, pid: int | None = None) -> int:
+    """Atomically acquire a PID file and record the PID under its lock.
+
+    Opens (creating if needed) the file, takes a non-blocking flock,
+    probes any stored PID with a zero signal, and takes the file over
+    only when the previous owner is gone. The PID is
+    written and fsynced only after the lock is held, and the flock stays
+    held for the lifetime of the returned descriptor — so concurrent
+    starts cannot both win, closing the check-then-spawn race.
+
+    Args:
+        path: PID file location
+        pid: PID to record (defaults to the current process)
+
+    Returns:
+        Open file descriptor holding the lock. Keep it open for the
+        lifetime of the process; closing it releases the lock.
+
+    Raises:
+        AlreadyRunningError: If the PID file is locked or its stored PID
+            belongs to a live process.
+    """
+    if pid is None:
+        pid = os.getpid()
+
+    fd = os.open(str(path), os.O_CREAT | os.O_RDWR, 0o644)
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        # Lock held by a starting or running instance
+        stored = _read_pid(fd)
+        os.close(fd)
+        raise AlreadyRunningError(stored or -1) from None
+
+    stored = _read_pid(fd)
+    if stored is not None and stored != pid and _alive(stored):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+        raise AlreadyRunningError(stored)
+
+    # Fresh file or stale owner: take it over. pwrite at offset 0 plus a
+    # truncate to the new length replaces the seek/truncate/write dance.
+    data = str(pid).encode()
+    os.pwrite(fd, data, 0)
+    os.ftruncate(fd, len(data))
+    os.fsync(fd)
+    return fd
+
+
+def release(fd: int, path: Path) -> None:
+    """Release the lock and remove the PID file."""
+    path.unlink(missing_ok=True)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
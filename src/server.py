@@ -6,43 +6,238 @@ can connect to simultaneously, providing a centralized memory system.
 
 from __future__ import annotations
 
+import asyncio
 import atexit
-import fcntl
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any, NoReturn
 
 from fastmcp import FastMCP
+from mcp.types import TextContent
 
+from src import pidfile
 from src.config import get_settings
 from src.memory import get_memory
 
+# unused-ignore on both lines: which one fires depends on whether
+# orjson (and its stubs) are installed in the checking environment
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
 # Constants
 PID_FILE = Path("/tmp/egregore.pid")
-LOCK_FILE = Path("/tmp/egregore.lock")
 LOG_FILE = Path("/tmp/egregore.log")
 
-# Setup logging
+# Pretty-print tool responses for human inspection; off by default since
+# indentation is CPU spent on every call that no client ever reads
+_DEBUG_JSON = os.environ.get("EGREGORE_DEBUG_JSON") == "1"
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response to JSON.
+
+    Uses orjson when installed — its C serializer handles the common
+    payload types natively instead of bouncing every non-str field
+    through Python-level default=str calls.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _DEBUG_JSON else 0)
+        encoded: str = orjson.dumps(obj, default=str, option=option).decode()
+        return encoded
+    return json.dumps(obj, default=str, indent=2 if _DEBUG_JSON else None)
+
+
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize one JSON value to bytes (no framing, no indentation)."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return encoded
+    return json.dumps(obj, default=str).encode()
+
+
+# The two hottest tools have fixed response shapes, so the constant
+# framing is precomputed bytes and the encoder only touches the
+# variable parts — no top-level dict build, one fewer full dumps pass
+_RECALL_PREFIX = b'{"query":'
+_RECALL_FOUND = b',"memories_found":'
+_RECALL_MEMORIES = b',"memories":'
+_STORE_PREFIX = b'{"status":"stored","memory_ids":'
+_STORE_CONTEXT = b',"context":'
+
+
+def _recall_response(query: str, found: int, memories: Any) -> str:
+    if _DEBUG_JSON:
+        return _dumps({"query": query, "memories_found": found, "memories": memories})
+    return (
+        _RECALL_PREFIX
+        + _dumps_bytes(query)
+        + _RECALL_FOUND
+        + str(found).encode()
+        + _RECALL_MEMORIES
+        + _dumps_bytes(memories)
+        + b"}"
+    ).decode()
+
+
+def _store_response(memory_ids: Any, context: str) -> str:
+    if _DEBUG_JSON:
+        return _dumps(
+            {"status": "stored", "memory_ids": memory_ids, "context": context}
+        )
+    return (
+        _STORE_PREFIX
+        + _dumps_bytes(memory_ids)
+        + _STORE_CONTEXT
+        + _dumps_bytes(context)
+        + b"}"
+    ).decode()
+
+# Setup logging. Tool handlers log on the hot path, so records go onto
+# an in-process queue and a background listener thread does the actual
+# file/stream writes — logger calls never block on disk I/O.
+_log_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout),
-    ],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(LOG_FILE),
+    logging.StreamHandler(sys.stdout),
+)
+_log_listener.start()
+# Flush queued records through the listener thread before exit
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("egregore")
 
 # Initialize FastMCP server with SSE transport
 mcp = FastMCP("egregore")
 
+# Blocking Mem0 work (HTTP to Qdrant and the embedding API) runs here so
+# tool handlers never stall the SSE event loop; sized generously since
+# the work is IO-bound, not CPU-bound
+_EXEC = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+
+class RecallBatcher:
+    """Coalesces concurrent recall calls into one batched search.
+
+    Submissions park on an asyncio queue; a single background task
+    drains it once 5 ms pass or 16 requests are pending, runs each
+    (limit, user_id) group as one batched vector search via
+    EgregoreMemory.recall_many, and fans the per-query results back out
+    through futures. Groups run concurrently and each resolves its
+    callers the moment it finishes, so a fast group never waits behind a
+    slow one. Lone requests keep the normal recall path (and its
+    semantic cache).
+    """
+
+    MAX_WAIT = 0.005  # seconds to linger collecting a batch
+    MAX_BATCH = 16
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[
+            tuple[str, int, str, asyncio.Future[Any]]
+        ] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def recall(self, query: str, limit: int, user_id: str) -> Any:
+        """Submit one recall and wait for its batched result."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._drain())
+        future: asyncio.Future[Any] = loop.create_future()
+        self._queue.put_nowait((query, limit, user_id, future))
+        return await future
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.MAX_WAIT
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            # Fire and forget: awaiting here would block collection of
+            # the next batch behind this one's slowest group
+            loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(
+        self, batch: list[tuple[str, int, str, asyncio.Future[Any]]]
+    ) -> None:
+        groups: dict[tuple[int, str], list[tuple[str, asyncio.Future[Any]]]] = {}
+        for query, limit, user_id, future in batch:
+            groups.setdefault((limit, user_id), []).append((query, future))
+
+        # Each group streams its results out as soon as it completes
+        # instead of callers waiting for the whole batch
+        await asyncio.gather(
+            *(
+                self._run_group(limit, user_id, items)
+                for (limit, user_id), items in groups.items()
+            )
+        )
+
+    async def _run_group(
+        self, limit: int, user_id: str, items: list[tuple[str, asyncio.Future[Any]]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        memory = get_memory()
+        queries = [query for query, _ in items]
+        try:
+            if len(queries) == 1:
+                results = [
+                    await loop.run_in_executor(
+                        _EXEC, partial(memory.recall, queries[0], limit, user_id)
+                    )
+                ]
+            else:
+                results = await loop.run_in_executor(
+                    _EXEC, partial(memory.recall_many, queries, limit, user_id)
+                )
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(items, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+_recall_batcher = RecallBatcher()
+
+# Shared sentinel for the common "no context, no tags" store; never
+# mutated (memory.store swaps in its own dict for falsy metadata)
+_EMPTY_METADATA: dict[str, Any] = {}
+
 
 @mcp.tool()
-def recall_memory(query: str, limit: int = 5) -> str:
+async def recall_memory(
+    query: str,
+    limit: int = 5,
+    context: str = "",
+    tags: str = "",
+    user_id: str = "egregore",
+) -> str:
     """Search the hive mind for relevant memories.
 
     Use this tool BEFORE asking questions or making decisions.
@@ -51,28 +246,73 @@ def recall_memory(query: str, limit: int = 5) -> str:
     Args:
         query: What you're looking for (be specific)
         limit: Maximum memories to retrieve (default: 5)
+        context: Optional context to filter by (e.g., "bugfix")
+        tags: Optional comma-separated tags; memories matching any are kept
+        user_id: User ID for memory isolation (default: "egregore")
 
     Returns:
         JSON string with matching memories
     """
     try:
-        memory = get_memory()
-        results = memory.recall(query=query, limit=limit)
-
-        # Format results nicely
-        formatted = {
-            "query": query,
-            "memories_found": len(results),
-            "memories": results,
-        }
-        return json.dumps(formatted, indent=2, default=str)
+        results = await _recall_batcher.recall(query, limit, user_id)
+        items = results.get("results", []) if isinstance(results, dict) else results
+
+        # Filter next to the data so discarded memories never cross the wire
+        if context or tags:
+            wanted = [t.strip() for t in tags.split(",") if t.strip()]
+            items = [
+                mem
+                for mem in items
+                if (not context or (mem.get("metadata") or {}).get("context") == context)
+                and (
+                    not wanted
+                    or any(t in (mem.get("metadata") or {}).get("tags", []) for t in wanted)
+                )
+            ]
+            if isinstance(results, dict):
+                results["results"] = items
+            else:
+                results = items
+
+        return _recall_response(query, len(items), results)
     except Exception as e:
         logger.error(f"Error recalling memory: {e}")
-        return json.dumps({"error": str(e), "query": query})
+        return _dumps({"error": str(e), "query": query})
 
 
 @mcp.tool()
-def store_memory(data: str, context: str = "", tags: str = "") -> str:
+async def recall_memory_stream(
+    query: str, limit: int = 5, user_id: str = "egregore"
+) -> list[TextContent]:
+    """Search the hive mind, returning one content block per memory.
+
+    Item-wise variant of recall_memory: each matching memory comes back
+    as its own text content block, so clients can render hits one at a
+    time instead of parsing a single aggregate JSON payload.
+
+    Args:
+        query: What you're looking for (be specific)
+        limit: Maximum memories to retrieve (default: 5)
+        user_id: User ID for memory isolation (default: "egregore")
+
+    Returns:
+        One JSON content block per matching memory
+    """
+    try:
+        results = await _recall_batcher.recall(query, limit, user_id)
+    except Exception as e:
+        logger.error(f"Error in recall_memory_stream: {e}")
+        return [
+            TextContent(type="text", text=_dumps({"error": str(e), "query": query}))
+        ]
+    items = results.get("results", []) if isinstance(results, dict) else results
+    return [TextContent(type="text", text=_dumps(mem)) for mem in items]
+
+
+@mcp.tool()
+async def store_memory(
+    data: str, context: str = "", tags: str = "", user_id: str = "egregore"
+) -> str:
     """Store a memory in the hive mind.
 
     Use this to teach the collective - bugs fixed, decisions made,
@@ -82,6 +322,7 @@ def store_memory(data: str, context: str = "", tags: str = "") -> str:
         data: The memory content to store
         context: Optional context (e.g., "bugfix", "architecture", "preference")
         tags: Comma-separated tags for categorization
+        user_id: User ID for memory isolation (default: "egregore")
 
     Returns:
         JSON string with storage result
@@ -89,105 +330,234 @@ def store_memory(data: str, context: str = "", tags: str = "") -> str:
     try:
         memory = get_memory()
 
-        # Build metadata
-        metadata: dict[str, Any] = {}
-        if context:
-            metadata["context"] = context
-        if tags:
-            metadata["tags"] = [t.strip() for t in tags.split(",") if t.strip()]
-
-        result = memory.store(data=data, metadata=metadata)
+        # Build metadata; the bare store is the common case, so it skips
+        # the dict/list allocations entirely
+        if not context and not tags:
+            metadata: dict[str, Any] = _EMPTY_METADATA
+        else:
+            metadata = {}
+            if context:
+                metadata["context"] = context
+            if "," in tags:
+                metadata["tags"] = [t.strip() for t in tags.split(",") if t.strip()]
+            elif tags.strip():
+                metadata["tags"] = [tags.strip()]
+
+        result = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, partial(memory.store, data=data, metadata=metadata)
+        )
 
         logger.info(f"Stored memory with context '{context}' and tags '{tags}'")
 
-        return json.dumps(
+        return _store_response(result.get("ids", []), context)
+    except Exception as e:
+        logger.error(f"Error storing memory: {e}")
+        return _dumps({"error": str(e), "data": data[:100]})
+
+
+@mcp.tool()
+async def embed_query(query: str) -> str:
+    """Embed a query with the server's embedding model.
+
+    Lets clients build local similarity caches in the same vector space
+    used for storage, without shipping API keys to the client.
+
+    Args:
+        query: Text to embed
+
+    Returns:
+        JSON string with the embedding vector
+    """
+    try:
+        memory = get_memory()
+        embedding = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, memory.embed, query
+        )
+        return _dumps({"embedding": embedding})
+    except Exception as e:
+        logger.error(f"Error embedding query: {e}")
+        return _dumps({"error": str(e)})
+
+
+@mcp.tool()
+async def batch_embed(texts: list[str]) -> str:
+    """Embed several texts in one tool call.
+
+    Amortizes the per-call transport overhead when clients warm their
+    similarity caches with many memories at once.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        JSON string with one embedding vector per input text
+    """
+    try:
+        memory = get_memory()
+        embeddings = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, memory.embed_batch, texts
+        )
+        return _dumps({"embeddings": embeddings})
+    except Exception as e:
+        logger.error(f"Error batch-embedding: {e}")
+        return _dumps({"error": str(e)})
+
+
+@mcp.tool()
+async def compute_stats(user_id: str = "egregore", sample: int = 100) -> str:
+    """Aggregate memory statistics in the hive mind.
+
+    Computes context and tag histograms server-side so clients get a small
+    summary instead of downloading full memory payloads just to count them.
+
+    Args:
+        user_id: User ID for memory isolation (default: "egregore")
+        sample: Maximum memories to aggregate over (default: 100)
+
+    Returns:
+        JSON string with total, context counts and tag counts
+    """
+    try:
+        memory = get_memory()
+        results = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, partial(memory.recall, "*", sample, user_id)
+        )
+        items = results.get("results", []) if isinstance(results, dict) else results
+
+        contexts: Counter[str] = Counter()
+        tags: Counter[str] = Counter()
+        for mem in items:
+            meta = mem.get("metadata") or {}
+            contexts[meta.get("context", "uncategorized")] += 1
+            tags.update(meta.get("tags", ()))
+
+        return _dumps(
             {
-                "status": "stored",
-                "memory_ids": result.get("ids", []),
-                "context": context,
-            },
-            indent=2,
-            default=str,
+                "total": len(items),
+                "contexts": dict(contexts),
+                "tags": dict(tags),
+            }
         )
     except Exception as e:
-        logger.error(f"Error storing memory: {e}")
-        return json.dumps({"error": str(e), "data": data[:100]})
+        logger.error(f"Error computing stats: {e}")
+        return _dumps({"error": str(e)})
+
+
+@mcp.tool()
+async def recent_memories(n: int = 10, user_id: str = "egregore") -> str:
+    """Return the most recent memories, newest first.
+
+    Args:
+        n: Number of memories to return (default: 10)
+        user_id: User ID for memory isolation (default: "egregore")
+
+    Returns:
+        JSON string with the memories already sorted by creation time
+    """
+    try:
+        memory = get_memory()
+        results = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, partial(memory.recall, "*", n, user_id)
+        )
+        items = results.get("results", []) if isinstance(results, dict) else results
+        # created_at is a top-level item key in Mem0 search results, not
+        # part of metadata; missing/None timestamps sort last
+        items.sort(key=lambda m: m.get("created_at") or "", reverse=True)
+
+        return _dumps(
+            {
+                "memories_found": len(items[:n]),
+                "memories": items[:n],
+            }
+        )
+    except Exception as e:
+        logger.error(f"Error fetching recent memories: {e}")
+        return _dumps({"error": str(e)})
+
+
+# Healthy health_check responses are served from this (timestamp, JSON)
+# pair for _HEALTH_TTL seconds so frequent monitoring probes don't each
+# cost a Qdrant round trip; failures are never cached
+_HEALTH_TTL = 5.0
+_LAST_HEALTH: tuple[float, str] | None = None
 
 
 @mcp.tool()
-def health_check() -> str:
+async def health_check() -> str:
     """Check Egregore system health.
 
     Returns:
         JSON string with health status of memory stores
     """
+    global _LAST_HEALTH
+    if _LAST_HEALTH is not None and time.monotonic() - _LAST_HEALTH[0] < _HEALTH_TTL:
+        return _LAST_HEALTH[1]
     try:
         memory = get_memory()
-        status = memory.health_check()
-        return json.dumps(
+        status = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, memory.health_check
+        )
+        components: dict[str, Any] = {
+            "vector_store": status.vector_store,
+            "graph_store": status.graph_store,
+        }
+        if status.error is not None:
+            components["error"] = status.error
+        payload = _dumps(
             {
-                "status": "healthy" if all(v for k, v in status.items() if k != "error") else "unhealthy",
-                "components": status,
-            },
-            indent=2,
-            default=str,
+                "status": "healthy" if status.healthy else "unhealthy",
+                "components": components,
+            }
         )
+        if status.healthy:
+            _LAST_HEALTH = (time.monotonic(), payload)
+        return payload
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return json.dumps({"status": "error", "message": str(e)})
+        return _dumps({"status": "error", "message": str(e)})
 
 
 class SingletonManager:
-    """Manages singleton behavior using file locking and PID files."""
+    """Manages singleton behavior via an atomically locked PID file."""
 
     def __init__(self) -> None:
         self.lock_fd: int | None = None
         self._original_pid: int = os.getpid()
 
     def acquire_lock(self) -> bool:
-        """Acquire exclusive lock to ensure only one instance runs.
+        """Acquire the PID file lock to ensure only one instance runs.
+
+        The PID is written under the flock itself (see src.pidfile), so a
+        competing start can never observe a locked-but-empty PID file.
 
         Returns:
             True if lock acquired successfully, False otherwise
         """
         try:
-            # Create lock file if it doesn't exist
-            LOCK_FILE.parent.mkdir(parents=True, exist_ok=True)
-            self.lock_fd = os.open(
-                str(LOCK_FILE),
-                os.O_CREAT | os.O_RDWR,
-                0o666,
-            )
-
-            # Try to acquire exclusive lock (non-blocking)
-            fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            logger.info("Acquired singleton lock")
+            PID_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self.lock_fd = pidfile.acquire(PID_FILE)
+            logger.info(f"Acquired singleton lock, PID {os.getpid()} in {PID_FILE}")
             return True
 
-        except (OSError, IOError) as e:
+        except pidfile.AlreadyRunningError as e:
+            logger.error(f"Another instance holds the PID file (PID: {e.pid})")
+            return False
+
+        except OSError as e:
             logger.error(f"Failed to acquire lock: {e}")
-            if self.lock_fd is not None:
-                os.close(self.lock_fd)
-                self.lock_fd = None
             return False
 
     def release_lock(self) -> None:
-        """Release the exclusive lock."""
+        """Release the PID file lock."""
         if self.lock_fd is not None:
             try:
-                fcntl.flock(self.lock_fd, fcntl.LOCK_UN)
-                os.close(self.lock_fd)
+                pidfile.release(self.lock_fd, PID_FILE)
                 logger.info("Released singleton lock")
-            except (OSError, IOError) as e:
+            except OSError as e:
                 logger.error(f"Error releasing lock: {e}")
             finally:
                 self.lock_fd = None
 
-    def write_pid(self) -> None:
-        """Write PID to file for process management."""
-        PID_FILE.write_text(str(os.getpid()))
-        logger.info(f"Wrote PID {os.getpid()} to {PID_FILE}")
-
     def cleanup(self) -> None:
         """Clean up PID file and release lock on exit."""
         # Only cleanup if we're the original process
@@ -195,14 +565,6 @@ class SingletonManager:
             return
 
         logger.info("Cleaning up singleton resources")
-
-        # Remove PID file
-        try:
-            PID_FILE.unlink(missing_ok=True)
-        except OSError as e:
-            logger.error(f"Error removing PID file: {e}")
-
-        # Release lock
         self.release_lock()
 
 
@@ -227,12 +589,9 @@ def run_server() -> NoReturn:
     if not singleton.acquire_lock():
         logger.error("Another Egregore server is already running")
         print("Error: Another Egregore server is already running", file=sys.stderr)
-        print(f"Check status with: egregore-server status", file=sys.stderr)
+        print("Check status with: egregore-server status", file=sys.stderr)
         sys.exit(1)
 
-    # Write PID file
-    singleton.write_pid()
-
     # Register cleanup on exit
     atexit.register(singleton.cleanup)
 
@@ -241,7 +600,7 @@ def run_server() -> NoReturn:
     port = int(os.environ.get("EGREGORE_PORT", settings.egregore_port))
 
     logger.info(f"Starting Egregore SSE server on {host}:{port}")
-    print(f"Egregore SSE server starting...")
+    print("Egregore SSE server starting...")
     print(f"  URL: http://{host}:{port}/sse")
     print(f"  PID: {os.getpid()}")
     print(f"  Log: {LOG_FILE}")
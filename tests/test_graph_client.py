@@ -9,20 +9,25 @@ from src.graph_client import GraphClient
 class TestGraphClient:
     """Test suite for GraphClient."""
 
-    @patch("src.graph_client.GraphDatabase")
+    @patch("neo4j.GraphDatabase")
     def test_init(self, mock_graphdb):
         """Test GraphClient initialization."""
         client = GraphClient()
         assert client._driver is None
 
-    @patch("src.graph_client.GraphDatabase")
+    @patch("neo4j.GraphDatabase")
     def test_get_statistics(self, mock_graphdb):
         """Test statistics retrieval."""
-        # Setup mock
+        # Setup mock: execute_read runs the transaction function against a
+        # mocked tx returning the combined single-query record
+        mock_tx = MagicMock()
+        mock_tx.run.return_value.single.return_value = {
+            "memory_count": 10,
+            "relation_count": 5,
+            "unique_relations": 2,
+        }
         mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = {"count": 10}
-        mock_session.run.return_value = mock_result
+        mock_session.execute_read.side_effect = lambda fn: fn(mock_tx)
 
         mock_driver = MagicMock()
         mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
@@ -34,11 +39,13 @@ class TestGraphClient:
         client = GraphClient()
         stats = client.get_statistics()
 
-        assert "memory_count" in stats
-        assert "relation_count" in stats
+        assert stats["memory_count"] == 10
+        assert stats["relation_count"] == 5
         assert "density" in stats
+        # Single round trip: one tx.run for all three counts
+        assert mock_tx.run.call_count == 1
 
-    @patch("src.graph_client.GraphDatabase")
+    @patch("neo4j.GraphDatabase")
     def test_create_memory(self, mock_graphdb):
         """Test memory creation."""
         # Setup mock
@@ -0,0 +1,114 @@
+"""Tests for the recall caches in src.memory."""
+
+import pytest
+
+# src.memory imports mem0 at module level; skip cleanly where the full
+# dependency set isn't installed
+pytest.importorskip("mem0")
+
+from src.memory import SemanticCache, _pack_results, _unpack_results
+
+
+def _payload(*ids: str) -> dict:
+    return {
+        "results": [
+            {
+                "id": i,
+                "memory": f"memory {i}",
+                "hash": f"hash-{i}",
+                "created_at": "2026-01-01T00:00:00",
+                "score": 0.9,
+                "metadata": {"context": "test"},
+            }
+            for i in ids
+        ]
+    }
+
+
+class TestPackResults:
+    """Test suite for columnar payload packing."""
+
+    def test_mem0_payload_round_trips_columnar(self):
+        """A Mem0-shaped {"results": [...]} payload packs to columns."""
+        payload = _payload("a", "b")
+        kind, _ = _pack_results(payload)
+        assert kind == "cols"
+        assert _unpack_results(_pack_results(payload)) == payload
+
+    def test_bare_item_list_round_trips_columnar(self):
+        """A bare uniform item list packs to columns too."""
+        items = _payload("a", "b")["results"]
+        kind, _ = _pack_results(items)
+        assert kind == "cols"
+        assert _unpack_results(_pack_results(items)) == items
+
+    def test_unpacked_payload_is_a_copy(self):
+        """Mutating an unpacked payload can't poison the cached entry."""
+        packed = _pack_results(_payload("a"))
+        first = _unpack_results(packed)
+        first["results"][0]["metadata"]["context"] = "mutated"
+        assert _unpack_results(packed)["results"][0]["metadata"] == {"context": "test"}
+
+    def test_nonuniform_items_fall_back_to_raw(self):
+        """Items with differing key sets are kept verbatim."""
+        kind, _ = _pack_results([{"a": 1}, {"b": 2}])
+        assert kind == "raw"
+
+    def test_empty_payload_falls_back_to_raw(self):
+        kind, data = _pack_results([])
+        assert kind == "raw"
+        assert data == []
+
+
+class TestSemanticCache:
+    """Test suite for the embedding-keyed recall cache."""
+
+    def test_hit_on_similar_embedding(self):
+        """A close-enough embedding returns the cached payload."""
+        cache = SemanticCache(capacity=8, threshold=0.95)
+        payload = _payload("a")
+        cache.insert("u", [1.0, 0.0, 0.0], 5, payload)
+        assert cache.lookup("u", [1.0, 0.01, 0.0], 5) == payload
+
+    def test_miss_below_threshold(self):
+        """A dissimilar embedding misses."""
+        cache = SemanticCache(capacity=8, threshold=0.95)
+        cache.insert("u", [1.0, 0.0, 0.0], 5, _payload("a"))
+        assert cache.lookup("u", [0.0, 1.0, 0.0], 5) is None
+
+    def test_miss_on_limit_mismatch(self):
+        """An entry cached for one limit doesn't answer another."""
+        cache = SemanticCache(capacity=8, threshold=0.95)
+        cache.insert("u", [1.0, 0.0, 0.0], 5, _payload("a"))
+        assert cache.lookup("u", [1.0, 0.0, 0.0], 10) is None
+
+    def test_miss_after_ttl(self):
+        """Entries older than the TTL are not served."""
+        cache = SemanticCache(capacity=8, threshold=0.95, ttl=0.0)
+        cache.insert("u", [1.0, 0.0, 0.0], 5, _payload("a"))
+        assert cache.lookup("u", [1.0, 0.0, 0.0], 5) is None
+
+    def test_namespaces_are_isolated(self):
+        """One user's entries never answer another user's lookups."""
+        cache = SemanticCache(capacity=8, threshold=0.95)
+        cache.insert("alice", [1.0, 0.0, 0.0], 5, _payload("a"))
+        assert cache.lookup("bob", [1.0, 0.0, 0.0], 5) is None
+
+    def test_ring_eviction_overwrites_oldest(self):
+        """Past capacity, inserts overwrite the oldest ring slot."""
+        cache = SemanticCache(capacity=2, threshold=0.95)
+        cache.insert("u", [1.0, 0.0, 0.0], 5, _payload("a"))
+        cache.insert("u", [0.0, 1.0, 0.0], 5, _payload("b"))
+        cache.insert("u", [0.0, 0.0, 1.0], 5, _payload("c"))
+        assert cache.lookup("u", [1.0, 0.0, 0.0], 5) is None
+        assert cache.lookup("u", [0.0, 1.0, 0.0], 5) == _payload("b")
+        assert cache.lookup("u", [0.0, 0.0, 1.0], 5) == _payload("c")
+
+    def test_invalidate_drops_namespace(self):
+        """Invalidation after a write drops only that user's entries."""
+        cache = SemanticCache(capacity=8, threshold=0.95)
+        cache.insert("alice", [1.0, 0.0, 0.0], 5, _payload("a"))
+        cache.insert("bob", [1.0, 0.0, 0.0], 5, _payload("b"))
+        cache.invalidate("alice")
+        assert cache.lookup("alice", [1.0, 0.0, 0.0], 5) is None
+        assert cache.lookup("bob", [1.0, 0.0, 0.0], 5) == _payload("b")
@@ -0,0 +1,87 @@
+"""Tests for PID file acquisition."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.pidfile import AlreadyRunningError, acquire, release
+
+
+def _dead_pid() -> int:
+    """PID of a process that has already exited."""
+    proc = subprocess.Popen([sys.executable, "-c", ""])
+    proc.wait()
+    return proc.pid
+
+
+class TestPidfile:
+    """Test suite for pidfile acquire/release."""
+
+    def test_acquire_writes_pid(self, tmp_path):
+        """Acquiring a fresh path records the PID."""
+        path = tmp_path / "test.pid"
+        fd = acquire(path)
+        try:
+            assert path.read_text() == str(os.getpid())
+        finally:
+            release(fd, path)
+
+    def test_acquire_records_explicit_pid(self, tmp_path):
+        """An explicit PID is written instead of the caller's."""
+        path = tmp_path / "test.pid"
+        fd = acquire(path, pid=os.getpid())
+        try:
+            assert path.read_text() == str(os.getpid())
+        finally:
+            release(fd, path)
+
+    def test_second_acquire_fails_while_lock_held(self, tmp_path):
+        """Contention: the flock holder wins, the second caller errors."""
+        path = tmp_path / "test.pid"
+        fd = acquire(path)
+        try:
+            with pytest.raises(AlreadyRunningError) as exc_info:
+                acquire(path)
+            assert exc_info.value.pid == os.getpid()
+        finally:
+            release(fd, path)
+
+    def test_stale_pid_is_taken_over(self, tmp_path):
+        """An unlocked file holding a dead PID is taken over."""
+        path = tmp_path / "test.pid"
+        path.write_text(str(_dead_pid()))
+        fd = acquire(path)
+        try:
+            assert path.read_text() == str(os.getpid())
+        finally:
+            release(fd, path)
+
+    def test_live_unlocked_pid_is_respected(self, tmp_path):
+        """An unlocked file holding a live foreign PID still blocks."""
+        path = tmp_path / "test.pid"
+        # PID 1 is always alive and never ours
+        path.write_text("1")
+        with pytest.raises(AlreadyRunningError) as exc_info:
+            acquire(path)
+        assert exc_info.value.pid == 1
+
+    def test_garbage_pidfile_is_taken_over(self, tmp_path):
+        """A file with unparseable contents is treated as stale."""
+        path = tmp_path / "test.pid"
+        path.write_text("not-a-pid")
+        fd = acquire(path)
+        try:
+            assert path.read_text() == str(os.getpid())
+        finally:
+            release(fd, path)
+
+    def test_release_removes_file_and_frees_lock(self, tmp_path):
+        """After release the path is gone and can be re-acquired."""
+        path = tmp_path / "test.pid"
+        fd = acquire(path)
+        release(fd, path)
+        assert not path.exists()
+        fd = acquire(path)
+        release(fd, path)
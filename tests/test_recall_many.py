@@ -0,0 +1,99 @@
+"""Tests for the batched recall path."""
+
+import contextlib
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+# src.memory imports mem0 at module level; skip cleanly where the full
+# dependency set isn't installed
+pytest.importorskip("mem0")
+
+from qdrant_client.http import models
+
+from src.config import Settings
+from src.memory import EgregoreMemory
+
+
+def _point(point_id: str, score: float, payload: dict) -> models.ScoredPoint:
+    return models.ScoredPoint(id=point_id, version=0, score=score, payload=payload)
+
+
+@contextlib.contextmanager
+def _memory_with_qdrant(qdrant: MagicMock):
+    """Yield a memory whose recall client wraps the given Qdrant mock."""
+    memory = EgregoreMemory(settings=Settings(embedding_api_key="test"))
+    store = MagicMock()
+    store.client = qdrant
+    store.collection_name = "test-collection"
+    recall_client = MagicMock()
+    recall_client.vector_store = store
+    with patch.object(
+        EgregoreMemory, "recall_client", new_callable=PropertyMock, return_value=recall_client
+    ):
+        yield memory
+
+
+class TestRecallMany:
+    """Test suite for EgregoreMemory.recall_many."""
+
+    @patch.object(EgregoreMemory, "embed_batch")
+    def test_batched_branch_uses_query_batch_points(self, mock_embed):
+        """One query_batch_points call answers all queries in order."""
+        qdrant = MagicMock(spec=["query_batch_points"])
+        qdrant.query_batch_points.return_value = [
+            models.QueryResponse(
+                points=[
+                    _point(
+                        "a",
+                        0.9,
+                        {
+                            "data": "memory a",
+                            "hash": "h",
+                            "created_at": "t",
+                            "user_id": "egregore",
+                            "context": "test",
+                        },
+                    )
+                ]
+            ),
+            models.QueryResponse(points=[_point("b", 0.8, {"data": "memory b"})]),
+        ]
+        mock_embed.return_value = [[1.0, 0.0], [0.0, 1.0]]
+
+        with _memory_with_qdrant(qdrant) as memory:
+            results = memory.recall_many(["first", "second"], limit=5, user_id="egregore")
+
+        qdrant.query_batch_points.assert_called_once()
+        _, kwargs = qdrant.query_batch_points.call_args
+        assert kwargs["collection_name"] == "test-collection"
+        requests = kwargs["requests"]
+        assert [r.query for r in requests] == [[1.0, 0.0], [0.0, 1.0]]
+        assert all(r.limit == 5 for r in requests)
+        # Results match the {"results": [...]} shape of the single-query
+        # path, with Mem0's internal payload keys kept out of metadata
+        assert results == [
+            {
+                "results": [
+                    {
+                        "id": "a",
+                        "memory": "memory a",
+                        "score": 0.9,
+                        "metadata": {"context": "test"},
+                    }
+                ]
+            },
+            {"results": [{"id": "b", "memory": "memory b", "score": 0.8, "metadata": {}}]},
+        ]
+
+    def test_fallback_without_batch_api(self):
+        """A store without query_batch_points recalls sequentially."""
+        qdrant = MagicMock(spec=[])
+        with (
+            _memory_with_qdrant(qdrant) as memory,
+            patch.object(
+                EgregoreMemory, "recall", side_effect=lambda q, **kw: {"results": [{"id": q}]}
+            ),
+        ):
+            results = memory.recall_many(["first", "second"], limit=5)
+        assert results == [{"results": [{"id": "first"}]}, {"results": [{"id": "second"}]}]
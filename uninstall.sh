@@ -119,7 +119,6 @@ stop_server() {
     fi
 
     # Remove lock and log files
-    rm -f /tmp/egregore.lock
     rm -f /tmp/egregore.log
 
     success "All Egregore processes stopped"